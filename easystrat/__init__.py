@@ -7,6 +7,13 @@ synchronisiert sie mit Strato E-Mail-Weiterleitungen.
 
 __version__ = "1.0.0"
 
-from .cli import cli
-
 __all__ = ["cli", "__version__"]
+
+
+def __getattr__(name: str):
+    """Importiert die CLI (und damit click) erst beim ersten Zugriff."""
+    if name == "cli":
+        from .cli import cli
+
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,7 @@ EasyVerein ist der Single Point of Truth.
 """
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -43,17 +44,14 @@ def cli(ctx: click.Context, debug: bool, env: Optional[Path]) -> None:
     """
     ctx.ensure_object(dict)
 
-    # .env laden
-    from dotenv import load_dotenv
-
-    if env:
-        load_dotenv(env)
-    else:
-        load_dotenv()
+    # Wenn kein Subcommand, Hilfe anzeigen (ohne Konfiguration zu laden)
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+        return
 
-    # Konfiguration laden
+    # Konfiguration laden (liest auch die .env-Datei, genau einmal)
     try:
-        config = load_config()
+        config = load_config(env)
     except Exception as e:
         click.secho(f"Fehler beim Laden der Konfiguration: {e}", fg="red", err=True)
         ctx.exit(1)
@@ -66,10 +64,6 @@ def cli(ctx: click.Context, debug: bool, env: Optional[Path]) -> None:
     ctx.obj["logger"] = logger
     ctx.obj["debug"] = debug
 
-    # Wenn kein Subcommand, Hilfe anzeigen
-    if ctx.invoked_subcommand is None:
-        click.echo(ctx.get_help())
-
 
 @cli.command()
 @click.option("--csv", "csv_format", is_flag=True, help="Export also CSV mit Mitgliederdetails")
@@ -100,7 +94,7 @@ def export(ctx: click.Context, csv_format: bool, output: Optional[Path]) -> None
 
 
 @cli.command()
-@click.argument("strato_file", type=click.Path(exists=True, path_type=Path))
+@click.argument("strato_file", type=click.Path(path_type=Path))
 @click.pass_context
 def compare(ctx: click.Context, strato_file: Path) -> None:
     """Vergleicht EasyVerein E-Mails mit einer Strato-Datei."""
@@ -110,7 +104,13 @@ def compare(ctx: click.Context, strato_file: Path) -> None:
     logger = ctx.obj["logger"]
 
     exporter = EmailExporter(config, logger)
-    exporter.compare_with_file(strato_file)
+    try:
+        exporter.compare_with_file(strato_file)
+    except (OSError, UnicodeDecodeError) as e:
+        # Fehlende Datei, Verzeichnis, fehlende Leserechte oder keine UTF-8-Datei
+        reason = e.reason if isinstance(e, UnicodeDecodeError) else e.strerror
+        logger.error(f"Datei nicht lesbar: {strato_file} ({reason})")
+        ctx.exit(1)
 
 
 @cli.command()
@@ -167,46 +167,37 @@ def test(ctx: click.Context, strato_only: bool, no_headless: bool) -> None:
     logger = ctx.obj["logger"]
 
     success = True
-
-    if not strato_only:
-        # EasyVerein testen
-        logger.info("Teste EasyVerein-Verbindung...")
-        ev_client = EasyVereinClient(config.easyverein, logger)
-        if ev_client.test_connection():
-            logger.info("✅ EasyVerein: OK")
+    checks: dict[str, Future] = {}
+
+    # Beide Prüfungen sind unabhängig und laufen parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if not strato_only:
+            # EasyVerein testen
+            logger.info("Teste EasyVerein-Verbindung...")
+            ev_client = EasyVereinClient(config.easyverein, logger)
+            checks["EasyVerein"] = executor.submit(ev_client.test_connection)
+
+        # Strato testen
+        if config.strato_webmail:
+            # Selenium nur laden, wenn Strato auch getestet wird
+            from .sync_selenium import test_strato_connection
+
+            if no_headless:
+                config.strato_webmail.headless = False
+
+            logger.info("Teste Strato Webmail-Verbindung...")
+            checks["Strato Webmail"] = executor.submit(test_strato_connection, config, logger)
         else:
-            logger.error("❌ EasyVerein: FEHLGESCHLAGEN")
-            success = False
-
-    # Strato testen
-    if config.strato_webmail:
-        if no_headless:
-            config.strato_webmail.headless = False
-
-        logger.info("Teste Strato Webmail-Verbindung...")
-        from .strato_selenium import StratoSeleniumClient
-        from .strato_selenium import StratoWebmailConfig as SeleniumConfig
-
-        client = StratoSeleniumClient(
-            SeleniumConfig(
-                email=config.strato_webmail.email,
-                password=config.strato_webmail.password,
-                webmail_url=config.strato_webmail.webmail_url,
-                headless=config.strato_webmail.headless,
-                browser=config.strato_webmail.browser,
-                timeout=config.strato_webmail.timeout,
-            ),
-            logger,
-        )
-
-        if client.test_connection():
-            logger.info("✅ Strato Webmail: OK")
+            logger.warning("⚠️  Strato-Zugangsdaten nicht konfiguriert")
+            if strato_only:
+                success = False
+
+    # Ergebnisse in fester Reihenfolge ausgeben
+    for name, check in checks.items():
+        if check.result():
+            logger.info(f"✅ {name}: OK")
         else:
-            logger.error("❌ Strato Webmail: FEHLGESCHLAGEN")
-            success = False
-    else:
-        logger.warning("⚠️  Strato-Zugangsdaten nicht konfiguriert")
-        if strato_only:
+            logger.error(f"❌ {name}: FEHLGESCHLAGEN")
             success = False
 
     if not success:
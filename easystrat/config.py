@@ -4,22 +4,39 @@ Konfigurationsmodul für die EasyVerein-Strato E-Mail-Synchronisierung.
 Lädt Einstellungen aus Umgebungsvariablen oder .env-Datei.
 """
 
+import importlib.util
 import logging
 import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
-from dotenv import load_dotenv
+# Werte, die in Umgebungsvariablen als "wahr" gelten
+TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+# Farbiges Logging ist optional
+HAS_COLORLOG = importlib.util.find_spec("colorlog") is not None
+
+
+def _env_bool(env: Mapping[str, str], key: str, default: str) -> bool:
+    """Liest eine boolesche Umgebungsvariable."""
+    return env.get(key, default).lower() in TRUE_VALUES
 
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """Richtet das Logging ein."""
     log_level = getattr(logging, level.upper(), logging.INFO)
 
+    logger = logging.getLogger("mail_sync")
+    logger.setLevel(log_level)
+
+    # Bei wiederholtem Aufruf nur das Level anpassen (keine doppelten Handler)
+    if logger.handlers:
+        return logger
+
     # Farbiges Logging wenn möglich
-    try:
+    if HAS_COLORLOG:
         import colorlog
 
         handler = colorlog.StreamHandler()
@@ -36,7 +53,7 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
                 },
             )
         )
-    except ImportError:
+    else:
         handler = logging.StreamHandler()
         handler.setFormatter(
             logging.Formatter(
@@ -44,9 +61,8 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
             )
         )
 
-    logger = logging.getLogger("mail_sync")
-    logger.setLevel(log_level)
     logger.addHandler(handler)
+    logger.propagate = False
 
     return logger
 
@@ -59,6 +75,8 @@ class EasyVereinConfig:
     api_version: str = "v2.0"
     group_id: Optional[int] = None  # Optionale Gruppenfilterung (z.B. Männerchor-ID)
     group_name: Optional[str] = None  # Gruppenname für Logging
+    cache_ttl: int = 0  # Gültigkeit des Mitglieder-Caches in Sekunden (0 = deaktiviert)
+    cache_file: str = ".easyverein_cache.json"  # Pfad zur Cache-Datei
 
 
 @dataclass
@@ -82,9 +100,13 @@ class StratoWebmailConfig:
     headless: bool = True
     browser: str = "chrome"
     timeout: int = 30
+    poll_frequency: float = 0.1  # Prüfintervall der expliziten Wartebedingungen (Sekunden)
     rule_name: str = "Männerchor"  # Name der Filterregel (Legacy, für alte Single-Rule)
     rule_prefix: str = "MC_"  # Prefix für individuelle Regeln pro Mitglied
     use_individual_rules: bool = True  # True = eine Regel pro Mitglied
+    debugger_address: Optional[str] = None  # Laufenden Chrome wiederverwenden (host:port)
+    profile_dir: Optional[str] = None  # Dauerhaftes Chrome-Profil (Cache, Sitzungscookies)
+    debug_screenshots: bool = False  # Screenshots/HTML-Dumps im Debug-Modus schreiben
 
 
 @dataclass
@@ -112,29 +134,25 @@ class SyncConfig:
         Raises:
             ValueError: Wenn erforderliche Umgebungsvariablen fehlen
         """
+        from dotenv import find_dotenv, load_dotenv
+
         # .env-Datei laden falls vorhanden
         if env_path:
             load_dotenv(env_path)
         else:
-            # Versuche .env im aktuellen Verzeichnis oder Elternverzeichnis zu finden
-            current_dir = Path(__file__).resolve().parent
-            possible_paths = [
-                Path.cwd() / ".env",  # Aktuelles Arbeitsverzeichnis
-                current_dir / ".env",  # easystrat/ Verzeichnis
-                current_dir.parent / ".env",  # Projektwurzel
-            ]
-
-            for env_file in possible_paths:
-                if env_file.exists():
-                    load_dotenv(env_file)
-                    break
-            else:
-                load_dotenv()  # Fallback: Standard-Verhalten
+            # Ab dem aktuellen Verzeichnis aufwärts suchen, sonst ab dem Package-Verzeichnis
+            # (Projektwurzel). Immer laden, da z.B. nur EV_API_KEY exportiert sein kann und die
+            # STRATO_*-Werte aus der .env kommen; gesetzte Variablen werden nicht überschrieben.
+            dotenv_path = find_dotenv(usecwd=True) or find_dotenv()
+            if dotenv_path:
+                load_dotenv(dotenv_path, override=False)
+
+        env = os.environ
 
         # Erforderliche Variable prüfen (nur EasyVerein)
         required_vars = ["EV_API_KEY"]
 
-        missing = [var for var in required_vars if not os.getenv(var)]
+        missing = [var for var in required_vars if not env.get(var)]
         if missing:
             raise ValueError(
                 f"Fehlende Umgebungsvariablen: {', '.join(missing)}\n"
@@ -142,59 +160,70 @@ class SyncConfig:
             )
 
         # EasyVerein Konfiguration
-        group_id_str = os.getenv("EV_GROUP_ID", "")
+        group_id_str = env.get("EV_GROUP_ID", "")
         easyverein = EasyVereinConfig(
-            api_key=os.getenv("EV_API_KEY", ""),
-            api_version=os.getenv("EV_API_VERSION", "v2.0"),
+            api_key=env.get("EV_API_KEY", ""),
+            api_version=env.get("EV_API_VERSION", "v2.0"),
             group_id=int(group_id_str) if group_id_str else None,
-            group_name=os.getenv("EV_GROUP_NAME", "Männerchor"),
+            group_name=env.get("EV_GROUP_NAME", "Männerchor"),
+            cache_ttl=int(env.get("EV_CACHE_TTL", "0")),
+            cache_file=env.get("EV_CACHE_FILE", ".easyverein_cache.json"),
         )
 
+        strato_email = env.get("STRATO_EMAIL", "")
+        strato_password = env.get("STRATO_PASSWORD", "")
+
         # Strato ManageSieve Konfiguration (Legacy, optional)
         strato = None
-        if os.getenv("STRATO_HOST") and os.getenv("STRATO_EMAIL") and os.getenv("STRATO_PASSWORD"):
+        if env.get("STRATO_HOST") and strato_email and strato_password:
             strato = StratoConfig(
-                host=os.getenv("STRATO_HOST", "imap.strato.de"),
-                port=int(os.getenv("STRATO_SIEVE_PORT", "4190")),
-                email=os.getenv("STRATO_EMAIL", ""),
-                password=os.getenv("STRATO_PASSWORD", ""),
-                sieve_script_name=os.getenv("SIEVE_SCRIPT_NAME", "chor_weiterleitung"),
+                host=env.get("STRATO_HOST", "imap.strato.de"),
+                port=int(env.get("STRATO_SIEVE_PORT", "4190")),
+                email=strato_email,
+                password=strato_password,
+                sieve_script_name=env.get("SIEVE_SCRIPT_NAME", "chor_weiterleitung"),
             )
 
         # Strato Webmail Konfiguration (Selenium-basiert)
         strato_webmail = None
-        if os.getenv("STRATO_EMAIL") and os.getenv("STRATO_PASSWORD"):
+        if strato_email and strato_password:
             strato_webmail = StratoWebmailConfig(
-                email=os.getenv("STRATO_EMAIL", ""),
-                password=os.getenv("STRATO_PASSWORD", ""),
-                webmail_url=os.getenv("STRATO_WEBMAIL_URL", "https://webmail.strato.de/"),
-                headless=os.getenv("STRATO_HEADLESS", "true").lower() in ("true", "1", "yes"),
-                browser=os.getenv("STRATO_BROWSER", "chrome").lower(),
-                timeout=int(os.getenv("STRATO_TIMEOUT", "30")),
-                rule_name=os.getenv("STRATO_RULE_NAME", "Männerchor"),
-                rule_prefix=os.getenv("STRATO_RULE_PREFIX", "MC_"),
-                use_individual_rules=os.getenv("STRATO_INDIVIDUAL_RULES", "true").lower()
-                in ("true", "1", "yes"),
+                email=strato_email,
+                password=strato_password,
+                webmail_url=env.get("STRATO_WEBMAIL_URL", "https://webmail.strato.de/"),
+                headless=_env_bool(env, "STRATO_HEADLESS", "true"),
+                browser=env.get("STRATO_BROWSER", "chrome").lower(),
+                timeout=int(env.get("STRATO_TIMEOUT", "30")),
+                poll_frequency=float(env.get("STRATO_POLL_FREQUENCY", "0.1")),
+                rule_name=env.get("STRATO_RULE_NAME", "Männerchor"),
+                rule_prefix=env.get("STRATO_RULE_PREFIX", "MC_"),
+                use_individual_rules=_env_bool(env, "STRATO_INDIVIDUAL_RULES", "true"),
+                debugger_address=env.get("STRATO_DEBUGGER_ADDRESS") or None,
+                profile_dir=env.get("STRATO_PROFILE_DIR") or None,
+                debug_screenshots=_env_bool(env, "STRATO_DEBUG_SCREENSHOTS", "false"),
             )
 
         return cls(
             easyverein=easyverein,
             strato=strato,
             strato_webmail=strato_webmail,
-            dry_run=os.getenv("DRY_RUN", "true").lower() in ("true", "1", "yes"),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            dry_run=_env_bool(env, "DRY_RUN", "true"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
         )
 
 
-def load_config() -> SyncConfig:
+def load_config(env_path: Optional[Path] = None) -> SyncConfig:
     """
     Lädt und validiert die Konfiguration.
 
+    Args:
+        env_path: Optionaler Pfad zur .env-Datei (sonst wird sie automatisch gesucht)
+
     Returns:
         Validierte SyncConfig-Instanz
     """
     try:
-        config = SyncConfig.from_env()
+        config = SyncConfig.from_env(env_path)
         return config
     except ValueError as e:
         print(f"Konfigurationsfehler: {e}", file=sys.stderr)
@@ -1,17 +1,53 @@
 """
 EasyVerein Client für den Abruf von Mitglieder-E-Mail-Adressen.
 
-Nutzt die python-easyverein Bibliothek für den API-Zugriff.
+Die Mitgliederliste wird direkt als JSON über httpx geladen, für alle
+weiteren Endpunkte wird die python-easyverein Bibliothek genutzt.
 """
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
-from typing import Optional, Set
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Optional, Set
 
-from easyverein import EasyvereinAPI
+import httpx
 
 from .config import EasyVereinConfig
 
+if TYPE_CHECKING:
+    from easyverein import EasyvereinAPI
+
+# Basis-URL der EasyVerein API (ohne Version)
+API_BASE_URL = "https://easyverein.com/api/"
+
+# Abgefragte Mitgliederfelder
+MEMBER_QUERY = (
+    "{id,membershipNumber,resignationDate,"
+    "contactDetails{firstName,familyName,privateEmail,companyEmail}}"
+)
+
+# Maximale Seitengröße der EasyVerein API (Standard der Bibliothek: 10)
+PAGE_SIZE = 100
+
+# Parallele Anfragen für die Einzelprüfung der Gruppenzugehörigkeit
+MEMBERSHIP_CHECK_WORKERS = 8
+
+
+def normalize_email(email: str) -> str:
+    """
+    Normalisiert eine E-Mail-Adresse (trimmen, kleinschreiben).
+
+    Das Ergebnis wird internalisiert, sodass gleiche Adressen dasselbe String-Objekt
+    teilen und Set-Vergleiche meist per Identität entschieden werden.
+    """
+    return sys.intern(email.strip().lower())
+
 
 @dataclass
 class MemberInfo:
@@ -42,78 +78,154 @@ class EasyVereinClient:
         """
         self.config = config
         self.logger = logger or logging.getLogger("mail_sync.easyverein")
-        self._client: Optional[EasyvereinAPI] = None
+        self._client: Optional["EasyvereinAPI"] = None
+        self._http: Optional[httpx.Client] = None
+        self._active_members: Optional[list[MemberInfo]] = None
 
-    def _get_client(self) -> EasyvereinAPI:
+    def _get_client(self) -> "EasyvereinAPI":
         """Lazy initialization des API-Clients."""
         if self._client is None:
+            from easyverein import EasyvereinAPI
+
             self._client = EasyvereinAPI(
                 api_key=self.config.api_key,
                 api_version=self.config.api_version,
             )
         return self._client
 
+    def _get_http_client(self) -> httpx.Client:
+        """Lazy initialization des HTTP-Clients für direkte JSON-Abfragen."""
+        if self._http is None:
+            self._http = httpx.Client(
+                base_url=f"{API_BASE_URL}{self.config.api_version}",
+                headers={"Authorization": f"Bearer {self.config.api_key}"},
+            )
+        return self._http
+
+    def _fetch_member_records(
+        self, query: str, params: Optional[dict[str, Any]] = None, max_retries: int = 3
+    ) -> list[dict]:
+        """
+        Lädt alle Seiten der Mitgliederliste als rohe JSON-Datensätze.
+
+        Umgeht die Pydantic-Modelle der Bibliothek, da nur wenige Felder benötigt werden.
+
+        Args:
+            query: GraphQL-ähnliche Query für die Felder
+            params: Zusätzliche Filterparameter
+            max_retries: Maximale Anzahl Versuche bei Rate Limiting
+
+        Returns:
+            Liste der Mitglieder als Dictionaries
+
+        Raises:
+            httpx.HTTPError: Bei Verbindungs- oder HTTP-Fehlern
+        """
+        http = self._get_http_client()
+        url: Optional[str] = "/member"
+        request_params: Optional[dict[str, Any]] = {
+            "query": query,
+            "limit": PAGE_SIZE,
+            **(params or {}),
+        }
+        records: list[dict] = []
+
+        while url:
+            for retry in range(max_retries):
+                response = http.get(url, params=request_params)
+                if response.status_code != 429 or retry == max_retries - 1:
+                    # Nach dem letzten Versuch nicht mehr warten, raise_for_status meldet 429
+                    break
+                # Rate Limiting - warte und versuche nochmal
+                retry_after = response.headers.get("Retry-After", "")
+                wait_time = int(retry_after) if retry_after.isdigit() else 10 * (retry + 1)
+                self.logger.warning(f"Rate Limit erreicht, warte {wait_time}s...")
+                time.sleep(wait_time)
+
+            response.raise_for_status()
+            data = response.json()
+            records.extend(data["results"])
+
+            # Die "next"-URL enthält bereits alle Parameter
+            url = data.get("next")
+            request_params = None
+
+        return records
+
     def _get_members_by_group(self, group_id: int, query: str) -> list:
         """
         Ruft Mitglieder einer bestimmten Gruppe ab.
 
-        Nutzt die python-easyverein Library um für jedes Mitglied zu prüfen,
-        ob es der Gruppe angehört. Implementiert Throttling um Rate Limiting zu umgehen.
+        Nutzt den ``memberGroups``-Filter der Member-API, sodass die Gruppenzugehörigkeit
+        serverseitig geprüft wird und nur die paginierte Mitgliederliste geladen werden muss.
+        Steht der Filter nicht zur Verfügung, wird die Zugehörigkeit pro Mitglied parallel
+        geprüft.
 
         Args:
             group_id: ID der Mitgliedergruppe
             query: GraphQL-ähnliche Query für die Felder
 
         Returns:
-            Liste von Member-Objekten, die zur Gruppe gehören
+            Liste von Mitglieder-Datensätzen, die zur Gruppe gehören
         """
-        import time
+        self.logger.debug(f"Lade Mitglieder der Gruppe {group_id}...")
+        try:
+            filtered_members = self._fetch_member_records(query, {"memberGroups": group_id})
+        except httpx.HTTPStatusError as e:
+            # Nur ein abgelehnter Filter (400) rechtfertigt die Einzelprüfung; bei Auth-,
+            # Rate-Limit- oder Serverfehlern würden sonst N weitere Anfragen folgen
+            if e.response.status_code != 400:
+                raise
+            self.logger.warning(f"Gruppenfilter nicht verfügbar ({e}), prüfe Mitglieder einzeln...")
+            all_members = self._fetch_member_records(query)
 
-        client = self._get_client()
+            self.logger.info(
+                f"Prüfe Gruppenzugehörigkeit für {len(all_members)} Mitglieder (kann dauern)..."
+            )
+            with ThreadPoolExecutor(max_workers=MEMBERSHIP_CHECK_WORKERS) as executor:
+                results = executor.map(self._check_membership, all_members, repeat(group_id))
+                filtered_members = [member for member in results if member is not None]
 
-        # Alle Mitglieder holen
-        self.logger.debug("Lade alle Mitglieder...")
-        all_members = client.member.get_all(query=query)
-        self.logger.debug(f"{len(all_members)} Mitglieder geladen")
+        self.logger.info(f"Gefunden: {len(filtered_members)} Mitglieder in Gruppe {group_id}")
+        return filtered_members
 
-        # Filtern nach Gruppenzugehörigkeit mit Rate-Limiting-Schutz
-        self.logger.info(
-            f"Prüfe Gruppenzugehörigkeit für {len(all_members)} Mitglieder (kann dauern)..."
-        )
-        filtered_members = []
+    def _check_membership(self, member: dict, group_id: int, max_retries: int = 3):
+        """
+        Prüft, ob ein einzelnes Mitglied der Gruppe angehört.
 
-        for i, member in enumerate(all_members):
-            if (i + 1) % 20 == 0:
-                self.logger.info(f"Fortschritt: {i + 1}/{len(all_members)} Mitglieder geprüft...")
+        Args:
+            member: Mitglieder-Datensatz von der API
+            group_id: ID der Mitgliedergruppe
+            max_retries: Maximale Anzahl Versuche bei Rate Limiting
 
-            # Prüfe ob Mitglied in der Gruppe ist
-            max_retries = 3
-            for retry in range(max_retries):
-                try:
-                    membership = client.member.member_group(member).get_group_membership(group_id)
-                    if membership is not None:
-                        filtered_members.append(member)
-                    break
-                except Exception as e:
-                    if "429" in str(e) or "too many" in str(e).lower():
-                        # Rate Limiting - warte und versuche nochmal
-                        wait_time = 10 * (retry + 1)  # Exponential backoff
-                        self.logger.warning(f"Rate Limit erreicht, warte {wait_time}s...")
-                        time.sleep(wait_time)
-                    else:
-                        self.logger.debug(f"Fehler bei Mitglied {member.membershipNumber}: {e}")
-                        break
-
-            # Kleine Pause zwischen Anfragen um Rate Limiting zu vermeiden
-            if i < len(all_members) - 1:
-                time.sleep(0.3)  # 300ms Pause
+        Returns:
+            Das Mitglied, wenn es zur Gruppe gehört, sonst None
+        """
+        from easyverein import EasyvereinAPITooManyRetriesException
 
-        self.logger.info(f"Gefunden: {len(filtered_members)} Mitglieder in Gruppe {group_id}")
-        return filtered_members
+        client = self._get_client()
 
-    def get_active_member_emails(self) -> Set[str]:
+        for retry in range(max_retries):
+            try:
+                membership = client.member.member_group(member["id"]).get_group_membership(group_id)
+                return member if membership is not None else None
+            except EasyvereinAPITooManyRetriesException as e:
+                # Rate Limiting - warte und versuche nochmal
+                wait_time = e.retry_after or 10 * (retry + 1)
+                self.logger.warning(f"Rate Limit erreicht, warte {wait_time}s...")
+                time.sleep(wait_time)
+            except Exception as e:
+                self.logger.debug(f"Fehler bei Mitglied {member.get('membershipNumber')}: {e}")
+                return None
+
+        return None
+
+    def _load_active_members(self) -> list[MemberInfo]:
         """
-        Ruft alle E-Mail-Adressen aktiver Mitglieder ab.
+        Lädt alle aktiven Mitglieder mit E-Mail-Adresse.
+
+        Das Ergebnis wird pro Client-Instanz zwischengespeichert, sodass
+        E-Mail-Liste und Mitgliederdetails nur eine Abfrage benötigen.
 
         Wenn eine group_id konfiguriert ist, werden nur Mitglieder dieser Gruppe abgerufen.
 
@@ -122,96 +234,95 @@ class EasyVereinClient:
         - resignationDate ist None (keine Kündigung)
 
         Returns:
-            Set mit E-Mail-Adressen aller aktiven Mitglieder
+            Liste mit MemberInfo-Objekten
         """
+        if self._active_members is not None:
+            return self._active_members
+
+        cache_key = self._cache_key(MEMBER_QUERY)
+        cached_members = self._read_cache(cache_key)
+        if cached_members is not None:
+            self.logger.info(f"{len(cached_members)} Mitglieder aus dem Cache geladen")
+            self._active_members = cached_members
+            return cached_members
+
         group_info = ""
         if self.config.group_id:
             group_info = f" der Gruppe '{self.config.group_name}' (ID: {self.config.group_id})"
         self.logger.info(f"Rufe active Mitglieder{group_info} von EasyVerein ab...")
 
-        client = self._get_client()
-        emails: Set[str] = set()
-        members_processed = 0
+        members: list[MemberInfo] = []
         members_skipped = 0
 
         try:
-            # Query für benötigte Felder
-            query = "{id,membershipNumber,resignationDate,contactDetails{firstName,familyName,privateEmail,companyEmail}}"
-
             if self.config.group_id:
                 # Gefilterte Abfrage nach Gruppe via direkten API-Call
-                all_members = self._get_members_by_group(self.config.group_id, query)
+                all_members = self._get_members_by_group(self.config.group_id, MEMBER_QUERY)
             else:
                 # Alle Mitglieder abrufen
-                all_members = client.member.get_all(query=query)
+                all_members = self._fetch_member_records(MEMBER_QUERY)
 
             self.logger.debug(f"Insgesamt {len(all_members)} Mitglieder gefunden")
 
+            # Lazy %-Formatierung: Debug-Meldungen kosten nichts, wenn DEBUG aus ist
             for member in all_members:
+                membership_number = member.get("membershipNumber")
+
                 # Prüfen ob das Mitglied aktiv ist (keine Kündigung)
-                if member.resignationDate is not None:
-                    self.logger.debug(
-                        f"Mitglied {member.membershipNumber} übersprungen (gekündigt)"
-                    )
+                if member.get("resignationDate") is not None:
+                    self.logger.debug("Mitglied %s übersprungen (gekündigt)", membership_number)
                     members_skipped += 1
                     continue
 
                 # E-Mail-Adresse extrahieren
-                email = self._extract_email(member)
-
-                if email:
-                    # E-Mail-Adresse normalisieren (kleinschreiben, trimmen)
-                    normalized_email = email.lower().strip()
-                    emails.add(normalized_email)
-                    members_processed += 1
-
-                    self.logger.debug(f"Mitglied {member.membershipNumber}: {normalized_email}")
-                else:
-                    self.logger.warning(
-                        f"Mitglied {member.membershipNumber} hat keine E-Mail-Adresse"
-                    )
+                contact = member.get("contactDetails") or {}
+                email = self._extract_email(contact)
+
+                if not email:
+                    self.logger.warning(f"Mitglied {membership_number} hat keine E-Mail-Adresse")
                     members_skipped += 1
+                    continue
+
+                normalized_email = normalize_email(email)
+                self.logger.debug("Mitglied %s: %s", membership_number, normalized_email)
+
+                members.append(
+                    MemberInfo(
+                        id=member["id"],
+                        email=normalized_email,
+                        first_name=contact.get("firstName") or None,
+                        last_name=contact.get("familyName") or None,
+                        membership_number=membership_number,
+                        is_active=True,
+                    )
+                )
 
             self.logger.info(
-                f"Mitglieder verarbeitet: {members_processed}, "
-                f"übersprungen: {members_skipped}, "
-                f"eindeutige E-Mails: {len(emails)}"
+                f"Mitglieder verarbeitet: {len(members)}, übersprungen: {members_skipped}"
             )
 
-            return emails
-
         except Exception as e:
             self.logger.error(f"Fehler beim Abrufen der Mitglieder: {e}")
             raise
 
-    def _extract_email(self, member) -> Optional[str]:
-        """
-        Extrahiert die E-Mail-Adresse aus den Mitgliederdaten.
+        self._write_cache(cache_key, members)
+        self._active_members = members
+        return members
 
-        Priorität:
-        1. privateEmail aus contactDetails
-        2. companyEmail aus contactDetails (Fallback)
+    def invalidate(self):
+        """Verwirft die zwischengespeicherten Mitglieder (z.B. für lang laufende Prozesse)."""
+        self._active_members = None
 
-        Args:
-            member: Mitgliederobjekt von der API
+    def get_active_member_emails(self) -> Set[str]:
+        """
+        Ruft alle E-Mail-Adressen aktiver Mitglieder ab.
 
         Returns:
-            E-Mail-Adresse oder None
+            Set mit E-Mail-Adressen aller aktiven Mitglieder
         """
-        if member.contactDetails is None:
-            return None
-
-        contact = member.contactDetails
-
-        # Bevorzugt privateEmail verwenden
-        if hasattr(contact, "privateEmail") and contact.privateEmail:
-            return contact.privateEmail
-
-        # Fallback auf companyEmail
-        if hasattr(contact, "companyEmail") and contact.companyEmail:
-            return contact.companyEmail
-
-        return None
+        emails = {member.email for member in self._load_active_members()}
+        self.logger.info(f"Eindeutige E-Mails: {len(emails)}")
+        return emails
 
     def get_members_details(self) -> list[MemberInfo]:
         """
@@ -220,47 +331,79 @@ class EasyVereinClient:
         Returns:
             Liste mit MemberInfo-Objekten
         """
-        self.logger.info("Rufe Mitgliederdetails von EasyVerein ab...")
+        members = list(self._load_active_members())
+        self.logger.info(f"{len(members)} active Mitglieder mit E-Mail gefunden")
+        return members
 
-        client = self._get_client()
-        members: list[MemberInfo] = []
+    def _cache_key(self, query: str) -> str:
+        """Bildet den Cache-Schlüssel aus Zugangsdaten, Gruppe und Query."""
+        raw = f"{self.config.api_key}|{self.config.api_version}|{self.config.group_id}|{query}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-        try:
-            all_members = client.member.get_all(
-                query="{id,membershipNumber,resignationDate,contactDetails{firstName,familyName,privateEmail,companyEmail}}"
-            )
+    def _read_cache(self, cache_key: str) -> Optional[list[MemberInfo]]:
+        """
+        Liest die aktiven Mitglieder aus dem lokalen Cache.
 
-            for member in all_members:
-                # Nur active Mitglieder
-                if member.resignationDate is not None:
-                    continue
+        Args:
+            cache_key: Schlüssel der aktuellen Abfrage
 
-                email = self._extract_email(member)
-                if not email:
-                    continue
+        Returns:
+            Liste mit MemberInfo-Objekten oder None wenn kein gültiger Cache vorliegt
+        """
+        if self.config.cache_ttl <= 0:
+            return None
 
-                contact = member.contactDetails
-                members.append(
-                    MemberInfo(
-                        id=member.id,
-                        email=email.lower().strip(),
-                        first_name=contact.firstName
-                        if contact and hasattr(contact, "firstName")
-                        else None,
-                        last_name=contact.familyName
-                        if contact and hasattr(contact, "familyName")
-                        else None,
-                        membership_number=member.membershipNumber,
-                        is_active=True,
-                    )
+        try:
+            with open(self.config.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Gültiges JSON, aber kein Objekt (Liste, Zahl, null) gilt als beschädigter Cache
+            if not isinstance(data, dict) or data.get("key") != cache_key:
+                return None
+            if time.time() - data.get("timestamp", 0) > self.config.cache_ttl:
+                self.logger.debug("Mitglieder-Cache abgelaufen")
+                return None
+            return [MemberInfo(**member) for member in data.get("members", [])]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_cache(self, cache_key: str, members: list[MemberInfo]):
+        """Schreibt die aktiven Mitglieder in den lokalen Cache."""
+        if self.config.cache_ttl <= 0:
+            return
+
+        # Erst in eine temporäre Datei schreiben und dann atomar ersetzen, damit parallele
+        # Aufrufe (z.B. export und compare) nie eine halb geschriebene Datei lesen
+        tmp_file = f"{self.config.cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "key": cache_key,
+                        "timestamp": time.time(),
+                        "members": [asdict(member) for member in members],
+                    },
+                    f,
                 )
+            os.replace(tmp_file, self.config.cache_file)
+            self.logger.debug(f"Mitglieder-Cache geschrieben: {self.config.cache_file}")
+        except OSError as e:
+            self.logger.debug(f"Mitglieder-Cache konnte nicht geschrieben werden: {e}")
 
-            self.logger.info(f"{len(members)} active Mitglieder mit E-Mail gefunden")
-            return members
+    def _extract_email(self, contact: dict) -> Optional[str]:
+        """
+        Extrahiert die E-Mail-Adresse aus den Kontaktdaten.
 
-        except Exception as e:
-            self.logger.error(f"Fehler beim Abrufen der Mitgliederdetails: {e}")
-            raise
+        Priorität:
+        1. privateEmail aus contactDetails
+        2. companyEmail aus contactDetails (Fallback)
+
+        Args:
+            contact: contactDetails-Datensatz von der API
+
+        Returns:
+            E-Mail-Adresse oder None
+        """
+        return contact.get("privateEmail") or contact.get("companyEmail") or None
 
     def test_connection(self) -> bool:
         """
@@ -270,9 +413,12 @@ class EasyVereinClient:
             True wenn Verbindung erfolgreich, sonst False
         """
         try:
-            client = self._get_client()
-            # Einfacher Test: Eine Seite Mitglieder abrufen
-            members, count = client.member.get(limit=1)
+            # Einfacher Test: Ein einzelnes Mitglied nur mit ID abrufen (minimale Antwort)
+            response = self._get_http_client().get(
+                "/member", params={"query": "{id}", "limit": 1, "showCount": "true"}
+            )
+            response.raise_for_status()
+            count = response.json().get("count")
             self.logger.info(f"EasyVerein-Verbindung OK. {count} Mitglieder insgesamt.")
             return True
         except Exception as e:
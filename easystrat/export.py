@@ -7,6 +7,7 @@ Erstellt Exportdateien zum manuellen Abgleich mit Strato-Weiterleitungen.
 
 import csv
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Set
@@ -14,6 +15,9 @@ from typing import Optional, Set
 from .config import SyncConfig
 from .easyverein_client import EasyVereinClient
 
+# Schreibpuffer für Exportdateien (128 KiB statt der Standard-8 KiB)
+EXPORT_BUFFER_SIZE = 1 << 17
+
 
 class EmailExporter:
     """
@@ -44,25 +48,25 @@ class EmailExporter:
         Returns:
             Pfad zur erstellten Datei
         """
+        # Ein Zeitpunkt für Dateiname und Kopfzeile
+        now = datetime.now()
         if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = Path(f"emails_{timestamp}.txt")
+            output_path = Path(f"emails_{now:%Y%m%d_%H%M%S}.txt")
 
         self.logger.info("Rufe E-Mail-Adressen aus EasyVerein ab...")
         emails = self.ev_client.get_active_member_emails()
 
-        # Sortiert schreiben
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(f"# EasyVerein E-Mail-Export vom {datetime.now().strftime('%d.%m.%Y %H:%M')}\n")
-            f.write(f"# Anzahl aktiver Mitglieder: {len(emails)}\n")
-            f.write("#\n")
-            f.write(
-                "# Diese E-Mail-Adressen sollten in Strato also Weiterleitung eingetragen sein:\n"
-            )
-            f.write("#\n\n")
+        header = (
+            f"# EasyVerein E-Mail-Export vom {now:%d.%m.%Y %H:%M}\n"
+            f"# Anzahl aktiver Mitglieder: {len(emails)}\n"
+            "#\n"
+            "# Diese E-Mail-Adressen sollten in Strato also Weiterleitung eingetragen sein:\n"
+            "#\n\n"
+        )
 
-            for email in sorted(emails):
-                f.write(f"{email}\n")
+        # Sortiert schreiben - Kopf und Liste in einem einzigen write()
+        with open(output_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(header + "".join(f"{email}\n" for email in sorted(emails)))
 
         self.logger.info(f"✅ {len(emails)} E-Mail-Adressen exportiert nach: {output_path}")
         return output_path
@@ -84,14 +88,16 @@ class EmailExporter:
         self.logger.info("Rufe Mitgliederdetails aus EasyVerein ab...")
         members = self.ev_client.get_members_details()
 
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
+        with open(
+            output_path, "w", encoding="utf-8", newline="", buffering=EXPORT_BUFFER_SIZE
+        ) as f:
             writer = csv.writer(f, delimiter=";")
             writer.writerow(["Mitgliedsnummer", "Vorname", "Nachname", "E-Mail"])
 
-            for m in sorted(members, key=lambda x: x.email):
-                writer.writerow(
-                    [m.membership_number or "", m.first_name or "", m.last_name or "", m.email]
-                )
+            writer.writerows(
+                [m.membership_number or "", m.first_name or "", m.last_name or "", m.email]
+                for m in sorted(members, key=lambda x: x.email)
+            )
 
         self.logger.info(f"✅ {len(members)} Mitglieder exportiert nach: {output_path}")
         return output_path
@@ -106,33 +112,45 @@ class EmailExporter:
             strato_file: Pfad zur Datei mit Strato-E-Mails
 
         Returns:
-            Dict mit Vergleichsergebnis
+            Dict mit Vergleichsergebnis (to_add/to_remove sortiert, unchanged als Set)
+
+        Raises:
+            OSError: Wenn die Strato-Datei nicht existiert oder nicht lesbar ist
+            UnicodeDecodeError: Wenn die Strato-Datei nicht UTF-8-kodiert ist
         """
         self.logger.info("Vergleiche EasyVerein mit Strato-Datei...")
 
+        # Strato-Datei zuerst in einem Stück einlesen - eine fehlende oder nicht lesbare
+        # Datei (OSError) fällt so vor dem API-Abruf auf; Kommentare und leere Zeilen überspringen
+        content = strato_file.read_text(encoding="utf-8").lower()
+        strato_emails: Set[str] = {
+            email
+            for line in content.splitlines()
+            if (email := line.strip()) and not email.startswith("#") and "@" in email
+        }
+
         # EasyVerein E-Mails holen
         ev_emails = self.ev_client.get_active_member_emails()
 
-        # Strato-Datei einlesen
-        strato_emails: Set[str] = set()
-        with open(strato_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip().lower()
-                # Kommentare und leere Zeilen überspringen
-                if line and not line.startswith("#") and "@" in line:
-                    strato_emails.add(line)
-
-        # Vergleich
-        to_add = ev_emails - strato_emails
-        to_remove = strato_emails - ev_emails
-        unchanged = ev_emails & strato_emails
+        # Vergleich (bei leerer Seite ohne Mengenoperationen)
+        to_add: Set[str]
+        to_remove: Set[str]
+        unchanged: Set[str]
+        if not strato_emails:
+            to_add, to_remove, unchanged = ev_emails, set(), set()
+        elif not ev_emails:
+            to_add, to_remove, unchanged = set(), strato_emails, set()
+        else:
+            to_add = ev_emails - strato_emails
+            to_remove = strato_emails - ev_emails
+            unchanged = ev_emails & strato_emails
 
         result = {
             "easyverein_count": len(ev_emails),
             "strato_count": len(strato_emails),
             "to_add": sorted(to_add),
             "to_remove": sorted(to_remove),
-            "unchanged": sorted(unchanged),
+            "unchanged": unchanged,  # Nur für die Anzahl benötigt, daher unsortiert
         }
 
         # Report ausgeben
@@ -153,14 +171,12 @@ class EmailExporter:
         if result["to_add"]:
             print(f"\n🟢 IN STRATO HINZUZUFÜGEN ({len(result['to_add'])}):")
             print("   (Diese E-Mails sind in EasyVerein aber NICHT in Strato)")
-            for email in result["to_add"]:
-                print(f"   + {email}")
+            sys.stdout.write("".join(f"   + {email}\n" for email in result["to_add"]))
 
         if result["to_remove"]:
             print(f"\n🔴 AUS STRATO ZU ENTFERNEN ({len(result['to_remove'])}):")
             print("   (Diese E-Mails sind in Strato aber NICHT mehr in EasyVerein)")
-            for email in result["to_remove"]:
-                print(f"   - {email}")
+            sys.stdout.write("".join(f"   - {email}\n" for email in result["to_remove"]))
 
         if not result["to_add"] and not result["to_remove"]:
             print("\n✨ Perfekt synchron! Keine Änderungen nötig.")
@@ -172,7 +188,7 @@ def main():
     """Standalone-Export ausführen."""
     import argparse
 
-    from config import load_config, setup_logging
+    from .config import load_config, setup_logging
 
     parser = argparse.ArgumentParser(description="EasyVerein E-Mail-Export")
     parser.add_argument("--csv", action="store_true", help="Als CSV mit Details exportieren")
@@ -188,7 +204,13 @@ def main():
     exporter = EmailExporter(config, logger)
 
     if args.compare:
-        exporter.compare_with_file(args.compare)
+        try:
+            exporter.compare_with_file(args.compare)
+        except (OSError, UnicodeDecodeError) as e:
+            # Fehlende Datei, Verzeichnis, fehlende Leserechte oder keine UTF-8-Datei
+            reason = e.reason if isinstance(e, UnicodeDecodeError) else e.strerror
+            logger.error(f"Datei nicht lesbar: {args.compare} ({reason})")
+            sys.exit(1)
     elif args.csv:
         exporter.export_members_csv(args.output)
     else:
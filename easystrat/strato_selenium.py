@@ -4,21 +4,26 @@ Strato Webmail Selenium Client für die Verwaltung von E-Mail-Weiterleitungen.
 Automatisiert das Strato Webmail (Open-Xchange) um Weiterleitungen zu verwalten.
 """
 
+import hashlib
 import logging
+import os
 import shutil
 import time
 from dataclasses import dataclass
-from typing import Optional, Set
+from typing import Iterable, List, Optional, Set, Tuple
 
 from selenium import webdriver
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
     ElementNotInteractableException,
     NoSuchElementException,
+    StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -34,6 +39,329 @@ try:
 except ImportError:
     WEBDRIVER_MANAGER_AVAILABLE = False
 
+# Solange bleibt die zuletzt geöffnete Filterregeln-Seite gültig (Sekunden)
+FILTER_PAGE_MAX_AGE = 30
+
+# Ressourcen, die Chrome auf Netzwerkebene nicht laden soll (nur Formulare werden bedient)
+BLOCKED_URL_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp3",
+    "*.mp4",
+    "*/analytics*",
+    "*/tracking*",
+)
+
+# Selektoren einmalig auf Modulebene statt bei jedem Aufruf neu aufzubauen
+FILTER_SETTINGS_HASH = "#!!&app=io.ox/settings&folder=virtual/settings/io.ox/mail/settings/filter"
+FILTER_SETTINGS_PATH = f"appsuite/{FILTER_SETTINGS_HASH}"
+LOGIN_USERNAME_CSS = '#io-ox-login-username, input[name="username"], input[type="email"]'
+LOGIN_PASSWORD_CSS = '#io-ox-login-password, input[name="password"], input[type="password"]'
+LOGIN_BUTTON_CSS = '#io-ox-login-button, button[type="submit"], input[type="submit"]'
+LOGIN_ERROR_CSS = '.alert-danger, .error-message, .login-error, [class*="error"]'
+MAIL_UI_CSS = ".folder-tree, .mail-item, .io-ox-mail"
+_RULES_SECTIONS = (
+    'details[data-section-id="RULES"]',
+    'details[data-section="io.ox/mail/settings/rules"]',
+)
+RULES_SECTION_CSS = ", ".join(_RULES_SECTIONS)
+RULES_SECTION_SUMMARY_CSS = ", ".join(f"{section} summary" for section in _RULES_SECTIONS)
+RULES_SECTION_OPEN_CSS = ", ".join(f"{section}[open]" for section in _RULES_SECTIONS)
+EDIT_DIALOG_CSS = 'input[id^="redirect_"], .modal.in, .modal-dialog'
+CLOSE_DIALOG_CSS = 'button.close, button[aria-label="Schließen"], .modal-header button'
+REMOVE_ACTION_CSS = (
+    'button[data-action="remove-action"], button.remove, button[aria-label*="Entfernen"]'
+)
+DROPDOWN_TOGGLE_CSS = ".dropdown-toggle"
+REDIRECT_INPUT_CSS = 'input[id^="redirect_"], input[name="to"]'
+REDIRECT_INPUT_SELECTORS = (
+    'input[id^="redirect_"]',
+    'input[name="to"]',
+    'input[name*="redirect"]',
+    'input[type="email"]',
+    'input[placeholder*="@"]',
+    'input[placeholder*="mail"]',
+)
+ACTION_DROPDOWN_SELECTORS = (
+    'select[name="actioncontent"]',
+    ".action-select",
+    "select.form-control",
+    'select[name*="action"]',
+    'select[id*="action"]',
+)
+ACTION_DROPDOWN_CSS = ", ".join(ACTION_DROPDOWN_SELECTORS)
+# Optionswerte für "Umleiten", in Prioritätsreihenfolge (Vergleich ohne Groß-/Kleinschreibung)
+REDIRECT_ACTION_VALUES = ("redirect", "umleiten", "forward")
+
+# (by, selector)-Paare in Prioritätsreihenfolge für _find_first_visible();
+# gleichwertige CSS-Selektoren sind zu einer Angabe zusammengefasst
+SAVE_BUTTON_SELECTORS = (
+    (By.XPATH, "//button[contains(text(), 'Speichern')]"),
+    (By.XPATH, "//a[contains(text(), 'Speichern')]"),
+    (By.CSS_SELECTOR, 'button[data-action="save"], button.btn-primary'),
+)
+ADD_RULE_SELECTORS = (
+    (By.XPATH, "//button[contains(text(), 'Neue Regel')]"),
+    (By.XPATH, "//a[contains(text(), 'Neue Regel')]"),
+    (By.CSS_SELECTOR, '[data-action="io.ox/mail/mailfilter/settings/filter/add"]'),
+    (By.XPATH, "//button[contains(text(), 'Add new rule')]"),
+)
+RULE_NAME_INPUT_CSS = 'input[name="rulename"]'
+RULE_NAME_SELECTORS = ((By.CSS_SELECTOR, f'{RULE_NAME_INPUT_CSS}, input[id*="rulename"]'),)
+ACTIONS_FIELDSET_SELECTORS = (
+    (By.CSS_SELECTOR, "fieldset:has(> legend.actions)"),
+    (By.XPATH, "//legend[contains(@class, 'actions')]/parent::fieldset"),
+    (By.XPATH, "//legend[contains(text(), 'Aktion')]/parent::fieldset"),
+)
+_LOWER_TEXT_XPATH = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜ', 'abcdefghijklmnopqrstuvwxyzäöü')"
+ADD_ACTION_LINK_SELECTORS = (
+    (
+        By.XPATH,
+        "//fieldset[legend[contains(@class, 'actions') or contains(text(), 'Aktion')]]"
+        f"//a[contains({_LOWER_TEXT_XPATH}, 'aktion')"
+        f" and contains({_LOWER_TEXT_XPATH}, 'hinzufügen')]",
+    ),
+    (
+        By.XPATH,
+        "//a[contains(., 'Aktion hinzufügen') or contains(@aria-label, 'Aktion hinzufügen')"
+        " or contains(@title, 'Aktion hinzufügen')]",
+    ),
+)
+ACTION_TOGGLE_SELECTORS = ((By.CSS_SELECTOR, DROPDOWN_TOGGLE_CSS),)
+REDIRECT_MENU_SELECTORS = (
+    (By.CSS_SELECTOR, 'a[data-value="redirect"]'),
+    (By.XPATH, "//a[contains(text(), 'Umleiten nach')]"),
+)
+NEW_REDIRECT_FIELD_SELECTORS = (
+    'input[id^="redirect_"]',
+    'input[id^="redirect"]',
+    'li.action input[type="text"]',
+)
+NEW_REDIRECT_FIELD_CSS = ", ".join(NEW_REDIRECT_FIELD_SELECTORS)
+DELETE_BUTTON_CSS = 'button[data-action="delete"], button[aria-label="Löschen"], button.delete'
+DELETE_BUTTON_XPATH = (
+    "//button[contains(text(), 'Löschen')] | "
+    "//a[contains(text(), 'Löschen')] | "
+    "//button[contains(text(), 'Delete')] | "
+    "//button[contains(text(), 'Entfernen')] | "
+    "//button[@data-action='delete'] | "
+    "//button[@aria-label='Löschen'] | "
+    "//button[contains(@class, 'delete')]"
+)
+# Dieselben Varianten relativ zur Regelzeile, damit nie der Button einer anderen Regel greift
+DELETE_BUTTON_IN_ROW_SELECTORS = (
+    (By.CSS_SELECTOR, DELETE_BUTTON_CSS),
+    (By.XPATH, DELETE_BUTTON_XPATH.replace("//", ".//")),
+)
+DELETE_MENU_XPATH = "//a[contains(text(), 'Löschen')] | //li[contains(text(), 'Löschen')]"
+CONFIRM_BUTTON_XPATH = (
+    "//button[contains(text(), 'OK')] | "
+    "//button[contains(text(), 'Ja')] | "
+    "//button[contains(text(), 'Bestätigen')] | "
+    "//button[contains(text(), 'Delete')]"
+)
+
+# JavaScript-Snippets, die mehrere DOM-Abfragen in einem einzigen WebDriver-Aufruf bündeln
+READ_INPUT_VALUES_JS = "return Array.from(document.querySelectorAll(arguments[0]), e => e.value);"
+FIND_EMPTY_FIELD_JS = """
+for (const selector of arguments[0]) {
+    const fields = Array.from(document.querySelectorAll(selector)).reverse();
+    for (const e of fields) {
+        if (!(e.value || '').trim() && e.offsetParent !== null && !e.disabled) return e;
+    }
+}
+return null;
+"""
+# Letztes leeres, sichtbares Textfeld, dessen id/name nach Umleitungsfeld aussieht
+# (Fallback, wenn die bekannten Umleitungs-Selektoren nichts liefern)
+FIND_REDIRECT_LIKE_FIELD_JS = """
+const fields = Array.from(document.querySelectorAll(
+    'input[type="text"], input[type="email"], input:not([type])')).reverse();
+return fields.find(e => {
+    if ((e.value || '').trim() || e.offsetParent === null || e.disabled) return false;
+    const id = (e.id || '').toLowerCase();
+    const name = (e.name || '').toLowerCase();
+    return id.includes('redirect') || name.includes('redirect') || name.includes('to');
+}) || null;
+"""
+# Regelliste der Filtereinstellungen
+RULE_LIST_CSS = '.rule-list li, .settings-list-view li, [data-type="rule"], .list-item, .listbox li'
+# Sammelt die Texte aller Regeln, die mit dem Prefix beginnen. Zuerst nur die Einträge der
+# Regelliste; erst wenn dort nichts passt, werden span/div-Elemente nach ihrem eigenen Text
+# durchsucht. Eine Stichprobe der Listentexte wird nur auf Anfrage (Debug) mitgeliefert.
+COLLECT_RULE_NAMES_JS = """
+const [prefix, listSelector, withSample] = arguments;
+const rules = new Set();
+const sample = [];
+for (const e of document.querySelectorAll(listSelector)) {
+    const text = (e.innerText || '').trim();
+    if (withSample && text && sample.length < 10) sample.push(text.slice(0, 50));
+    if (text.startsWith(prefix)) rules.add(text);
+}
+if (!rules.size) {
+    for (const e of document.querySelectorAll('li, span, div')) {
+        const ownText = Array.from(e.childNodes)
+            .some(n => n.nodeType === Node.TEXT_NODE && n.data.trim().startsWith(prefix));
+        if (!ownText) continue;
+        const text = (e.innerText || '').trim();
+        if (text.startsWith(prefix)) rules.add(text);
+    }
+}
+return {rules: Array.from(rules), sample: sample};
+"""
+# Sucht den Listeneintrag der Regel mit genau diesem Namen (erste Zeile des Texts);
+# sonst ein Element, dessen eigener Text der Name ist, bzw. dessen umgebendes li
+FIND_RULE_ITEM_JS = """
+const [name, listSelector] = arguments;
+for (const e of document.querySelectorAll(listSelector + ', li')) {
+    if ((e.innerText || '').trim().split('\\n')[0].trim() === name) return e;
+}
+for (const e of document.querySelectorAll('span, div, a')) {
+    const own = Array.from(e.childNodes).some(
+        n => n.nodeType === Node.TEXT_NODE && n.data.trim() === name);
+    if (own) return e.closest('li') || e;
+}
+return null;
+"""
+# Sucht das Feld, dessen Wert (klein geschrieben, ohne Leerzeichen) arguments[1] entspricht
+FIND_FIELD_BY_VALUE_JS = """
+for (const e of document.querySelectorAll(arguments[0])) {
+    if ((e.value || '').toLowerCase().trim() === arguments[1]) return e;
+}
+return null;
+"""
+# Setzt den Wert eines Text-/E-Mail-Feldes samt input/change-Event; False bei anderen Elementen
+SET_TEXT_INPUT_JS = """
+const e = arguments[0];
+const type = (e.getAttribute('type') || 'text').toLowerCase();
+if (e.tagName !== 'INPUT' || !['text', 'email', 'search'].includes(type)) return false;
+e.value = arguments[1];
+e.dispatchEvent(new Event('input', {bubbles: true}));
+e.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+# Beschreibt die ersten N Input-Felder (type, name, id, sichtbar) für die Fehlersuche
+DESCRIBE_INPUTS_JS = """
+const all = document.querySelectorAll('input');
+const rows = Array.from(all).slice(0, arguments[0]).map(e => [
+  e.getAttribute('type'), e.getAttribute('name'), e.getAttribute('id'),
+  e.getClientRects().length > 0,
+]);
+return [all.length, rows];
+"""
+# Wählt in einem <select> die erste Option, deren Wert (ohne Groß-/Kleinschreibung) einem der
+# Kandidaten entspricht; die Reihenfolge der Kandidaten bestimmt die Priorität
+SELECT_OPTION_BY_VALUE_JS = """
+const select = arguments[0];
+const options = Array.from(select.options);
+for (const candidate of arguments[1]) {
+  const i = options.findIndex(o => (o.value || '').toLowerCase() === candidate);
+  if (i < 0) continue;
+  select.selectedIndex = i;
+  select.dispatchEvent(new Event('change', {bubbles: true}));
+  return options[i].value;
+}
+return null;
+"""
+# Scrollt ein Element ohne Animation in die Mitte, falls es nicht bereits im Viewport liegt
+SCROLL_INTO_VIEW_JS = """
+const e = arguments[0];
+const r = e.getBoundingClientRect();
+if (r.top >= 0 && r.bottom <= window.innerHeight) return;
+e.scrollIntoView({behavior: 'instant', block: 'center'});
+"""
+# Sucht das erste sichtbare Element, dessen Text, aria-label oder title einen der Texte enthält
+FIND_BY_TEXT_JS = """
+const texts = arguments[1];
+for (const e of document.querySelectorAll(arguments[0])) {
+    if (e.offsetParent === null) continue;
+    const label = [e.textContent, e.getAttribute('aria-label'), e.getAttribute('title')].join(' ');
+    if (texts.some(t => label.includes(t))) return e;
+}
+return null;
+"""
+# Liefert das erste sichtbare, aktive Element zur ersten passenden (by, selector)-Angabe;
+# XPath wird über document.evaluate ausgewertet, optional relativ zu einem Wurzelelement. Vom Browser nicht unterstützte CSS-Selektoren werden
+# übersprungen.
+FIND_FIRST_VISIBLE_JS = """
+const [selectors, root] = arguments;
+const scope = root || document;
+for (const [by, selector] of selectors) {
+    let nodes;
+    if (by === 'xpath') {
+        const result = document.evaluate(
+            selector, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        nodes = Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+    } else {
+        try {
+            nodes = scope.querySelectorAll(selector);
+        } catch (err) {
+            continue;  // z. B. :has() in älteren Browsern
+        }
+    }
+    for (const e of nodes) {
+        if (e.offsetParent !== null && !e.disabled) return e;
+    }
+}
+return null;
+"""
+# Zählt leere, sichtbare Felder bzw. füllt sie in Dokumentreihenfolge mit den übergebenen Werten
+COUNT_EMPTY_FIELDS_JS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .filter(e => !(e.value || '').trim() && e.offsetParent !== null && !e.disabled).length;
+"""
+FILL_EMPTY_FIELDS_JS = """
+const fields = Array.from(document.querySelectorAll(arguments[0]))
+    .filter(e => !(e.value || '').trim() && e.offsetParent !== null && !e.disabled);
+const values = arguments[1];
+let filled = 0;
+for (; filled < values.length && filled < fields.length; filled++) {
+    const e = fields[filled];
+    e.value = values[filled];
+    e.dispatchEvent(new Event('input', {bubbles: true}));
+    e.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return filled;
+"""
+# Entfernt ab dem Index arguments[2] angelegte Aktionszeilen ohne ausgefülltes Umleitungsfeld
+REMOVE_UNUSED_ACTIONS_JS = """
+const buttons = Array.from(document.querySelectorAll(arguments[0])).slice(arguments[2]);
+let removed = 0;
+for (const b of buttons.reverse()) {
+    const row = b.closest('li') || b.parentElement;
+    const input = row && row.querySelector(arguments[1]);
+    if (input && (input.value || '').trim()) continue;
+    b.click();
+    removed++;
+}
+return removed;
+"""
+# Sucht den "Aktion hinzufügen"-Button; die Prüfungen laufen in Prioritätsreihenfolge
+FIND_ADD_BUTTON_JS = """
+const nodes = Array.from(document.querySelectorAll('button, a, [data-action], [class*="add"]'));
+const text = n => (n.textContent || '').trim();
+const cls = n => (typeof n.className === 'string' ? n.className : '');
+const isLink = n => n.tagName === 'BUTTON' || n.tagName === 'A';
+const checks = [
+    n => isLink(n) && text(n).includes('Aktion hinzufügen'),
+    n => n.tagName === 'BUTTON' && n.getAttribute('data-action') === 'add-action',
+    n => isLink(n) && text(n).includes('Add action'),
+    n => cls(n).includes('add') && cls(n).includes('action'),
+    n => n.tagName === 'BUTTON' && text(n).includes('+'),
+    n => n.getAttribute('data-action') === 'add',
+];
+for (const check of checks) {
+    const match = nodes.find(check);
+    if (match) return match;
+}
+return null;
+"""
+
 
 @dataclass
 class StratoWebmailConfig:
@@ -45,9 +373,13 @@ class StratoWebmailConfig:
     headless: bool = True
     browser: str = "chrome"
     timeout: int = 30
+    poll_frequency: float = 0.1  # Prüfintervall der expliziten Wartebedingungen (Sekunden)
     rule_name: str = "Maennerchor"  # Name der Filterregel (Legacy)
     rule_prefix: str = "MC_"  # Prefix für individuelle Regeln pro Mitglied
     use_individual_rules: bool = True  # True = eine Regel pro Mitglied
+    debugger_address: Optional[str] = None  # Laufenden Chrome wiederverwenden (host:port)
+    profile_dir: Optional[str] = None  # Dauerhaftes Chrome-Profil (Cache, Sitzungscookies)
+    debug_screenshots: bool = False  # Screenshots/HTML-Dumps im Debug-Modus schreiben
 
 
 class StratoSeleniumClient:
@@ -58,6 +390,8 @@ class StratoSeleniumClient:
 
     HINWEIS: Dieser Client ist abhängig von der UI-Struktur des Strato Webmail.
     Bei Layout-Änderungen durch Strato kann eine Anpassung nötig sein.
+
+    Eine Instanz (und ihr WebDriver) darf nur von einem Thread benutzt werden.
     """
 
     def __init__(self, config: StratoWebmailConfig, logger: Optional[logging.Logger] = None):
@@ -72,6 +406,14 @@ class StratoSeleniumClient:
         self.logger = logger or logging.getLogger("mail_sync.strato_selenium")
         self.driver: Optional[webdriver.Chrome | webdriver.Firefox] = None
         self._logged_in = False
+        self._attached = False  # True = an laufenden Browser angehängt
+        self._edit_dialog_open = False  # Bearbeitungsdialog der Regel ist geöffnet
+        self._filter_page_at = 0.0  # Zeitpunkt, zu dem die Filterregeln-Seite erreicht wurde
+        self._waits: dict[int, WebDriverWait] = {}  # WebDriverWait je Timeout
+        self._last_screenshot_digest: Optional[str] = None  # Unveränderte Ansicht nicht speichern
+        # Screenshots und HTML-Dumps nur im Debug-Modus und nur auf Wunsch
+        # (PNG-Kodierung, Dateizugriff und page_source blockieren jeden Aufruf)
+        self._debug = config.debug_screenshots and self.logger.isEnabledFor(logging.DEBUG)
 
     def _get_chromedriver_path(self) -> str | None:
         """Findet den ChromeDriver-Pfad (System oder via webdriver-manager)."""
@@ -107,46 +449,197 @@ class StratoSeleniumClient:
         """Erstellt den WebDriver mit automatischem Driver-Management."""
         if self.config.browser.lower() == "firefox":
             options = FirefoxOptions()
+            # Nicht auf Bilder/Fonts warten - die Elemente werden ohnehin explizit abgewartet
+            options.page_load_strategy = "eager"
             if self.config.headless:
                 options.add_argument("--headless")
             options.add_argument("--width=1920")
             options.add_argument("--height=1080")
+            # Bilder und Web-Fonts nicht laden, es werden nur Formulare bedient
+            options.set_preference("permissions.default.image", 2)
+            options.set_preference("gfx.downloadable_fonts.enabled", False)
             driver_path = self._get_geckodriver_path()
             if driver_path:
                 service = FirefoxService(driver_path)
                 self.driver = webdriver.Firefox(service=service, options=options)
             else:
                 self.driver = webdriver.Firefox(options=options)
+        elif self.config.debugger_address:
+            # An einen bereits laufenden Chrome (--remote-debugging-port) anhängen,
+            # spart den Browserstart und übernimmt eine bestehende Anmeldung
+            options = ChromeOptions()
+            options.page_load_strategy = "eager"
+            options.debugger_address = self.config.debugger_address
+            driver_path = self._get_chromedriver_path()
+            if driver_path:
+                service = ChromeService(driver_path)
+                self.driver = webdriver.Chrome(service=service, options=options)
+            else:
+                self.driver = webdriver.Chrome(options=options)
+            self._attached = True
+            self.logger.debug(f"An laufenden Browser angehängt: {self.config.debugger_address}")
         else:
             # Chrome also Standard
             options = ChromeOptions()
+            # Nicht auf Bilder/Fonts warten - die Elemente werden ohnehin explizit abgewartet
+            options.page_load_strategy = "eager"
             if self.config.headless:
                 options.add_argument("--headless=new")
             options.add_argument("--window-size=1920,1080")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
+            if self.config.profile_dir:
+                # Dauerhaftes Profil: HTTP-Cache der Appsuite und Sitzungscookie bleiben erhalten
+                profile_dir = os.path.expanduser(self.config.profile_dir)
+                os.makedirs(profile_dir, exist_ok=True)
+                options.add_argument(f"--user-data-dir={profile_dir}")
             # Deutsch also Sprache
             options.add_argument("--lang=de-DE")
+            # Bilder und Benachrichtigungen blockieren, es werden nur Formulare bedient
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option(
+                "prefs",
+                {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                },
+            )
             driver_path = self._get_chromedriver_path()
             if driver_path:
                 service = ChromeService(driver_path)
                 self.driver = webdriver.Chrome(service=service, options=options)
             else:
                 self.driver = webdriver.Chrome(options=options)
+            # Bilder, Web-Fonts, Medien und Tracking gar nicht erst anfragen
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)}
+            )
 
-        self.driver.implicitly_wait(10)
+        # Keine impliziten Wartezeiten: sie addieren sich zu jedem WebDriverWait und lassen
+        # jede fehlschlagende find_elements-Probe 10s blockieren. Gewartet wird nur explizit.
+        self.driver.implicitly_wait(0)
         self.logger.debug(f"WebDriver erstellt ({self.config.browser})")
 
+    def _wait(self, timeout: int) -> WebDriverWait:
+        """Gibt ein (pro Timeout wiederverwendetes) WebDriverWait für den aktuellen Driver zurück."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.config.poll_frequency,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+            )
+        return wait
+
     def _wait_and_find(self, by: By, value: str, timeout: int = None, clickable: bool = False):
         """Wartet auf ein Element und gibt es zurück."""
         timeout = timeout or self.config.timeout
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
 
         if clickable:
             return wait.until(EC.element_to_be_clickable((by, value)))
         return wait.until(EC.presence_of_element_located((by, value)))
 
+    def _wait_by_id(self, element_id: str, css: str, timeout: int = None, clickable: bool = False):
+        """
+        Wartet auf ein Element über seine ID (getElementById) und nur ersatzweise über CSS.
+
+        Args:
+            element_id: Stabile ID des Elements in OX Webmail
+            css: Alternative CSS-Selektoren, falls die ID nicht existiert
+            timeout: Maximale Wartezeit
+            clickable: Auf klickbares statt nur vorhandenes Element warten
+
+        Returns:
+            Das gefundene WebElement (sonst TimeoutException)
+        """
+        timeout = timeout or self.config.timeout
+        condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
+        return self._wait(timeout).until(
+            EC.any_of(condition((By.ID, element_id)), condition((By.CSS_SELECTOR, css)))
+        )
+
+    def _wait_for_rule_item(self, rule_name: str, timeout: int = 10):
+        """
+        Wartet auf den Listeneintrag der Regel mit genau diesem Namen.
+
+        Statt einer XPath-Textsuche über das ganze Dokument prüft ein Script zuerst die
+        Einträge der Regelliste (siehe FIND_RULE_ITEM_JS).
+
+        Returns:
+            Das WebElement der Regel (sonst TimeoutException)
+        """
+        return self._wait(timeout).until(
+            lambda d: d.execute_script(FIND_RULE_ITEM_JS, rule_name, RULE_LIST_CSS)
+        )
+
+    def _wait_present(self, by: By, value: str, timeout: int = None) -> bool:
+        """Wartet bis ein Element vorhanden ist; gibt bei Timeout False zurück."""
+        try:
+            self._wait_and_find(by, value, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_for_edit_dialog(self, timeout: int = 10) -> bool:
+        """Wartet bis der Bearbeitungsdialog einer Regel sichtbar ist."""
+        try:
+            self._wait(timeout).until(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, EDIT_DIALOG_CSS))
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_until_removed(self, element, timeout: int = 5):
+        """Wartet bis ein Element aus dem DOM entfernt wurde (statt fester Pause)."""
+        try:
+            self._wait(timeout).until(EC.staleness_of(element))
+        except TimeoutException:
+            self.logger.debug(f"Element nach {timeout}s noch vorhanden")
+
+    def _find_by_text(self, tag: str, texts: Tuple[str, ...]):
+        """Sucht per JavaScript das erste sichtbare tag-Element mit einem der Texte (oder None)."""
+        return self.driver.execute_script(FIND_BY_TEXT_JS, tag, list(texts))
+
+    def _find_first_visible(self, selectors, root=None):
+        """
+        Sucht mit einem Script-Aufruf das erste sichtbare, aktive Element.
+
+        Die Reihenfolge der Liste wird immer eingehalten: spezifische Selektoren stehen vorn,
+        generische Fallbacks (z.B. button.btn-primary) dürfen nie vorgezogen werden.
+
+        Args:
+            selectors: (by, selector)-Paare in Prioritätsreihenfolge (CSS oder XPath)
+            root: Optionales Element, auf das die Suche beschränkt wird
+
+        Returns:
+            Das gefundene WebElement oder None
+        """
+        return self.driver.execute_script(
+            FIND_FIRST_VISIBLE_JS, [list(pair) for pair in selectors], root
+        )
+
+    def _wait_first_visible(self, selectors, timeout: int = 10):
+        """
+        Wartet, bis _find_first_visible für eine der Selektor-Varianten ein Element liefert.
+
+        Returns:
+            Das gefundene WebElement oder None nach Ablauf des Timeouts
+        """
+        try:
+            return self._wait(timeout).until(lambda d: self._find_first_visible(selectors))
+        except TimeoutException:
+            return None
+
+    def _wait_for_text(self, tag: str, texts: Tuple[str, ...], timeout: int = None):
+        """Wartet bis _find_by_text ein Element liefert (sonst TimeoutException)."""
+        timeout = timeout or self.config.timeout
+        return self._wait(timeout).until(lambda d: self._find_by_text(tag, texts))
+
     def _wait_and_click(self, by: By, value: str, timeout: int = None):
         """Wartet auf ein Element und klickt es an."""
         element = self._wait_and_find(by, value, timeout, clickable=True)
@@ -157,17 +650,39 @@ class StratoSeleniumClient:
             self.driver.execute_script("arguments[0].click();", element)
         return element
 
+    def _dump_debug(self, name: str, html: bool = True):
+        """
+        Speichert Screenshot (und HTML) als debug_<name>.*, nur mit debug_screenshots.
+
+        Zeigt der Browser dieselbe Ansicht wie beim letzten Aufruf (gleicher SHA-256 des
+        Screenshots), wird nichts geschrieben.
+        """
+        if not self._debug or not self.driver:
+            return
+        try:
+            png = self.driver.get_screenshot_as_png()
+            digest = hashlib.sha256(png).hexdigest()
+            if digest == self._last_screenshot_digest:
+                self.logger.debug(f"Ansicht unverändert, debug_{name}.* nicht gespeichert")
+                return
+            self._last_screenshot_digest = digest
+            with open(f"debug_{name}.png", "wb") as f:
+                f.write(png)
+            if html:
+                with open(f"debug_{name}.html", "w", encoding="utf-8") as f:
+                    f.write(self.driver.page_source)
+            self.logger.debug(f"Debug-Dateien gespeichert: debug_{name}.*")
+        except Exception:
+            pass
+
     def _safe_click(self, element):
         """Klickt ein Element sicher an mit Scroll und Fallbacks."""
         try:
-            # Erst zum Element scrollen
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element
-            )
-            time.sleep(0.3)
+            # Nur scrollen, wenn das Element nicht schon im sichtbaren Bereich liegt
+            self.driver.execute_script(SCROLL_INTO_VIEW_JS, element)
 
             # Warten bis Element sichtbar ist
-            WebDriverWait(self.driver, 5).until(EC.visibility_of(element))
+            self._wait(5).until(EC.visibility_of(element))
             element.click()
         except (
             ElementClickInterceptedException,
@@ -179,15 +694,17 @@ class StratoSeleniumClient:
 
     def _safe_send_keys(self, element, text: str):
         """Gibt Text sicher in ein Element ein mit Scroll und Fallbacks."""
+        # Text-/E-Mail-Felder direkt per JavaScript setzen: ein WebDriver-Aufruf statt einem
+        # pro Zeichen. Die OX-Felder übernehmen den Wert beim input/change-Event.
+        if self.driver.execute_script(SET_TEXT_INPUT_JS, element, text):
+            return
+
         try:
-            # Erst zum Element scrollen
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element
-            )
-            time.sleep(0.3)
+            # Nur scrollen, wenn das Element nicht schon im sichtbaren Bereich liegt
+            self.driver.execute_script(SCROLL_INTO_VIEW_JS, element)
 
             # Warten bis Element sichtbar ist
-            WebDriverWait(self.driver, 5).until(EC.visibility_of(element))
+            self._wait(5).until(EC.visibility_of(element))
             element.clear()
             element.send_keys(text)
         except (ElementNotInteractableException, TimeoutException):
@@ -217,6 +734,39 @@ class StratoSeleniumClient:
             self.disconnect()
             return False
 
+    def _ensure_connected(self) -> bool:
+        """
+        Stellt sicher, dass eine angemeldete, noch lebende Sitzung besteht.
+
+        Eine bestehende Sitzung wird weiterverwendet, egal wie alt sie ist (ein Neuaufbau
+        würde offene, ungespeicherte Dialoge verwerfen). Nur wenn sie fehlt oder der Browser
+        nicht mehr antwortet, wird (einmal) neu verbunden.
+
+        Returns:
+            True wenn eine nutzbare Sitzung besteht
+        """
+        if self._logged_in and self.driver and self.driver.session_id:
+            try:
+                # Günstige Lebendprüfung: ein minimaler Script-Aufruf
+                self.driver.execute_script("return 1;")
+                return True
+            except WebDriverException as e:
+                if self._edit_dialog_open:
+                    self.logger.warning(
+                        "Sitzung beendet - ungespeicherte Änderungen gehen verloren"
+                    )
+                self.logger.info(f"Sitzung nicht mehr erreichbar ({e.msg}), verbinde neu...")
+
+        if self.driver:
+            self.disconnect()
+        return self.connect()
+
+    def _ensure_edit_dialog(self) -> bool:
+        """Öffnet den Bearbeitungsdialog der Regel, falls er nicht bereits offen ist."""
+        if not self._ensure_connected():
+            return False
+        return self.open_rule_for_editing()
+
     def _login(self) -> bool:
         """
         Meldet sich im Strato Webmail an.
@@ -227,74 +777,62 @@ class StratoSeleniumClient:
         self.logger.info(f"Öffne {self.config.webmail_url}...")
         self.driver.get(self.config.webmail_url)
 
+        # Wiederverwendeter Browser bzw. dauerhaftes Profil ist evtl. noch angemeldet:
+        # auf Login-Formular oder Mail-Ansicht warten und bei letzterer das Formular überspringen
+        if self._attached or self.config.profile_dir:
+            self._wait_present(By.CSS_SELECTOR, f"{MAIL_UI_CSS}, #io-ox-login-username", timeout=10)
+            if self.driver.find_elements(By.CSS_SELECTOR, MAIL_UI_CSS):
+                self._logged_in = True
+                self.logger.info("✅ Bestehende Sitzung wiederverwendet")
+                return True
+
         try:
             # Warte auf Login-Formular
             self.logger.debug("Warte auf Login-Formular...")
 
             # E-Mail-Feld finden und ausfüllen - Strato OX spezifische IDs
-            email_field = self._wait_and_find(
-                By.CSS_SELECTOR,
-                '#io-ox-login-username, input[name="username"], input[type="email"]',
-                timeout=20,
-            )
+            email_field = self._wait_by_id("io-ox-login-username", LOGIN_USERNAME_CSS, timeout=20)
             email_field.clear()
             email_field.send_keys(self.config.email)
             self.logger.debug("E-Mail eingegeben")
 
             # Passwort-Feld
-            password_field = self._wait_and_find(
-                By.CSS_SELECTOR,
-                '#io-ox-login-password, input[name="password"], input[type="password"]',
-            )
+            password_field = self._wait_by_id("io-ox-login-password", LOGIN_PASSWORD_CSS)
             password_field.clear()
             password_field.send_keys(self.config.password)
             self.logger.debug("Passwort eingegeben")
 
             # Login-Button - Strato OX spezifisch
-            login_button = self._wait_and_find(
-                By.CSS_SELECTOR,
-                '#io-ox-login-button, button[type="submit"], input[type="submit"]',
-                clickable=True,
-            )
+            login_button = self._wait_by_id("io-ox-login-button", LOGIN_BUTTON_CSS, clickable=True)
             self._safe_click(login_button)
             self.logger.debug("Login-Button geklickt")
 
             # Warte auf erfolgreichen Login (Posteingang oder Dashboard)
-            time.sleep(3)  # Kurze Pause für Seitenaufbau
-
             # Prüfe ob Login erfolgreich war
             # Open-Xchange zeigt nach Login typischerweise die Mail-App
             try:
-                WebDriverWait(self.driver, 20).until(
-                    lambda d: "appsuite" in d.current_url.lower()
-                    or d.find_elements(By.CSS_SELECTOR, ".folder-tree, .mail-item, .io-ox-mail")
+                self._wait(20).until(
+                    lambda d: (
+                        "appsuite" in d.current_url.lower()
+                        or d.find_elements(By.CSS_SELECTOR, MAIL_UI_CSS)
+                    )
                 )
                 self._logged_in = True
                 self.logger.info("✅ Login erfolgreich")
                 return True
             except TimeoutException:
-                # Prüfe auf Fehlermeldung
-                error_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, '.alert-danger, .error-message, .login-error, [class*="error"]'
-                )
-                if error_elements:
-                    self.logger.error(f"Login fehlgeschlagen: {error_elements[0].text}")
-                else:
+                # Prüfe auf Fehlermeldung (nur das erste Element wird benötigt)
+                try:
+                    error_element = self.driver.find_element(By.CSS_SELECTOR, LOGIN_ERROR_CSS)
+                    self.logger.error(f"Login fehlgeschlagen: {error_element.text}")
+                except NoSuchElementException:
                     self.logger.error("Login fehlgeschlagen (Timeout)")
                 return False
 
         except TimeoutException as e:
             self.logger.error(f"Timeout beim Login: {e}")
             # Debug: Screenshot und HTML speichern
-            try:
-                self.driver.save_screenshot("debug_login_timeout.png")
-                with open("debug_login_page.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                self.logger.debug(
-                    "Debug-Dateien gespeichert: debug_login_timeout.png, debug_login_page.html"
-                )
-            except Exception:
-                pass
+            self._dump_debug("login_timeout")
             return False
         except Exception as e:
             self.logger.error(f"Login-Fehler: {e}")
@@ -306,116 +844,84 @@ class StratoSeleniumClient:
 
         In Open-Xchange: Einstellungen → Mail → Filterregeln
 
+        Wurde die Seite vor weniger als FILTER_PAGE_MAX_AGE Sekunden erreicht und zeigt
+        der Browser sie noch an, wird nicht erneut navigiert.
+
         Returns:
             True wenn Navigation erfolgreich
         """
-        self.logger.info("Navigiere zu Filtereinstellungen...")
+        # Ein evtl. offener Bearbeitungsdialog würde die Navigation verdecken
+        if self._edit_dialog_open:
+            self._close_edit_dialog()
 
-        # Debug: Screenshot nach Login
-        try:
-            self.driver.save_screenshot("debug_after_login.png")
-            with open("debug_after_login.html", "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            self.logger.debug("Debug nach Login gespeichert")
-        except Exception:
-            pass
-
-        try:
-            # Strato OX Webmail: Einstellungen-Dropdown öffnen
-            # Das Zahnrad-Icon ist in einem Dropdown under ID io-ox-topbar-settings-dropdown-icon
-
-            settings_dropdown = self._wait_and_find(
-                By.CSS_SELECTOR,
-                '#io-ox-topbar-settings-dropdown-icon button[aria-label="Einstellungen"]',
-                timeout=10,
-                clickable=True,
-            )
-            self._safe_click(settings_dropdown)
-            self.logger.debug("Einstellungen-Dropdown geöffnet")
-            time.sleep(1)
-
-            # Screenshot nach Dropdown
-            try:
-                self.driver.save_screenshot("debug_settings_dropdown.png")
-                with open("debug_settings_dropdown.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-            except Exception:
-                pass
+        if (
+            time.monotonic() - self._filter_page_at < FILTER_PAGE_MAX_AGE
+            and "filter" in self.driver.current_url.lower()
+        ):
+            self.logger.debug("Bereits auf der Filterregeln-Seite")
+            self._filter_page_at = time.monotonic()
+            return True
 
-            # Warte auf Dropdown-Menü und klicke auf "Alle Einstellungen" oder navigiere direkt
-            try:
-                # Versuche "Alle Einstellungen" zu finden
-                all_settings = self._wait_and_find(
-                    By.XPATH,
-                    "//a[contains(text(), 'Alle Einstellungen')] | //a[contains(text(), 'All settings')]",
-                    timeout=5,
-                    clickable=True,
-                )
-                self._safe_click(all_settings)
-                self.logger.debug("'Alle Einstellungen' geklickt")
-            except TimeoutException:
-                # Alternative: Direkte URL zu Einstellungen
-                self.logger.debug("Versuche direkte Navigation zu Einstellungen...")
-                self.driver.get(
-                    f"{self.config.webmail_url}appsuite/#!!&app=io.ox/settings&folder=virtual/settings/io.ox/mail/settings/filter"
-                )
+        self.logger.info("Navigiere zu Filtereinstellungen...")
+        # 0.0 heißt: Aufrufer verlangt nach einem Fehler eine frische Seite
+        reset = self._filter_page_at == 0.0
+        self._filter_page_at = 0.0
 
-            time.sleep(3)
+        try:
+            # Direkt zu den Filterregeln statt über Einstellungen-Dropdown und "Alle
+            # Einstellungen": innerhalb der Appsuite genügt ein Wechsel des Hash (kein
+            # Neuladen der Single-Page-App), sonst einmal per URL
+            current_url = self.driver.current_url
+            if reset and "filter" in current_url.lower():
+                # Gleicher Hash wäre wirkungslos und ließe den halb bearbeiteten DOM stehen
+                self.logger.debug("Lade Mail-Filterregeln neu...")
+                self.driver.refresh()
+            elif "/appsuite" in current_url:
+                self.logger.debug("Wechsle innerhalb der Appsuite zu den Mail-Filterregeln...")
+                self.driver.execute_script("location.hash = arguments[0];", FILTER_SETTINGS_HASH)
+                if not self._wait_present(By.CSS_SELECTOR, RULES_SECTION_CSS, timeout=5):
+                    self.driver.get(f"{self.config.webmail_url}{FILTER_SETTINGS_PATH}")
+            else:
+                self.logger.debug("Navigiere direkt zu Mail-Filterregeln per URL...")
+                self.driver.get(f"{self.config.webmail_url}{FILTER_SETTINGS_PATH}")
 
-            # Screenshot nach Settings-Navigation
-            try:
-                self.driver.save_screenshot("debug_after_settings.png")
-                with open("debug_after_settings.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-            except Exception:
-                pass
+            # Statt fester Pause: warten bis der Regeln-Abschnitt geladen ist
+            self._wait_present(By.CSS_SELECTOR, RULES_SECTION_CSS, timeout=10)
 
-            # Jetzt sollten wir in den Einstellungen sein
-            # Navigiere DIREKT via URL zu den Filterregeln
-            self.logger.debug("Navigiere direkt zu Mail-Filterregeln per URL...")
-            self.driver.get(
-                f"{self.config.webmail_url}appsuite/#!!&app=io.ox/settings&folder=virtual/settings/io.ox/mail/settings/filter"
+            # Prüfe ob wir auf der Filter-Seite sind: URL oder Regeln-Abschnitt im DOM
+            # (statt page_source, das das ganze DOM überträgt)
+            on_filter_page = "filter" in self.driver.current_url.lower() or bool(
+                self.driver.find_elements(By.CSS_SELECTOR, RULES_SECTION_CSS)
             )
-            time.sleep(4)
 
-            # Screenshot der Filteransicht
-            try:
-                self.driver.save_screenshot("debug_filter_view.png")
-                with open("debug_filter_view.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                self.logger.debug("Filter-Debug gespeichert")
-            except Exception:
-                pass
-
-            # Prüfe ob wir auf der Filter-Seite sind
-            if (
-                "filter" in self.driver.current_url.lower()
-                or "filterregel" in self.driver.page_source.lower()
-                or "mail filter" in self.driver.page_source.lower()
-            ):
+            if on_filter_page:
                 self.logger.debug("Filterregeln-Seite erreicht")
 
-                # Klicke auf den "Regeln" Abschnitt um ihn aufzuklappen
-                try:
-                    rules_section = self._wait_and_find(
-                        By.CSS_SELECTOR,
-                        'details[data-section-id="RULES"] summary, details[data-section="io.ox/mail/settings/rules"] summary',
-                        timeout=5,
-                        clickable=True,
-                    )
-                    self._safe_click(rules_section)
-                    self.logger.debug("Regeln-Abschnitt aufgeklappt")
-                    time.sleep(2)
-                except TimeoutException:
-                    self.logger.debug("Regeln-Abschnitt nicht gefunden oder bereits aufgeklappt")
+                # Klicke auf den "Regeln" Abschnitt um ihn aufzuklappen - nur wenn er noch
+                # zu ist, sonst würde der Klick ihn wieder zuklappen
+                if self.driver.find_elements(By.CSS_SELECTOR, RULES_SECTION_OPEN_CSS):
+                    self.logger.debug("Regeln-Abschnitt bereits aufgeklappt")
+                else:
+                    try:
+                        rules_section = self._wait_and_find(
+                            By.CSS_SELECTOR, RULES_SECTION_SUMMARY_CSS, timeout=5, clickable=True
+                        )
+                        self._safe_click(rules_section)
+                        self.logger.debug("Regeln-Abschnitt aufgeklappt")
+                        self._wait_present(By.CSS_SELECTOR, RULES_SECTION_OPEN_CSS, timeout=5)
+                    except TimeoutException:
+                        self.logger.debug("Regeln-Abschnitt nicht gefunden")
 
+                self._filter_page_at = time.monotonic()
                 return True
 
             self.logger.warning("Konnte Filterregeln nicht finden")
+            self._dump_debug("filter_view")
             return False
 
         except Exception as e:
             self.logger.error(f"Fehler bei Navigation: {e}")
+            self._dump_debug("navigation_error")
             return False
 
     def get_forwarding_addresses(self) -> Set[str]:
@@ -425,114 +931,100 @@ class StratoSeleniumClient:
         Returns:
             Set mit E-Mail-Adressen
         """
-        if not self._logged_in:
-            if not self.connect():
-                return set()
+        if not self._ensure_connected():
+            return set()
 
         emails: Set[str] = set()
 
         try:
-            if not self._navigate_to_mail_filter():
-                self.logger.error("Konnte nicht zu Filterregeln navigieren")
-                return set()
-
-            time.sleep(2)
-
-            # Suche nach der spezifischen Filterregel
-            rule_name = self.config.rule_name
-            self.logger.debug(f"Suche Filterregel: {rule_name}")
-
-            # Find die Regel in der Liste und klicke auf Bearbeiten
-            try:
-                # Method 1: Suche nach dem Regelnamen und klicke darauf
-                rule_element = self._wait_and_find(
-                    By.XPATH,
-                    f"//div[contains(@class, 'rule') or contains(@class, 'list-item')]//span[contains(text(), '{rule_name}')] | //li[contains(text(), '{rule_name}')]",
-                    timeout=10,
-                )
-                self._safe_click(rule_element)
-                self.logger.debug(f"Regel '{rule_name}' ausgewählt")
-                time.sleep(1)
-            except TimeoutException:
-                self.logger.warning(
-                    f"Regel '{rule_name}' nicht direkt gefunden, durchsuche Seite..."
-                )
-
-            # Klicke auf Bearbeiten-Button
-            try:
-                edit_button = self._wait_and_find(
-                    By.XPATH,
-                    "//button[contains(text(), 'Bearbeiten')] | //a[contains(text(), 'Bearbeiten')] | //button[contains(@aria-label, 'Bearbeiten')] | //button[contains(@title, 'Bearbeiten')]",
-                    timeout=5,
-                    clickable=True,
-                )
-                self._safe_click(edit_button)
-                self.logger.debug("Bearbeiten-Button geklickt")
-                time.sleep(2)
-            except TimeoutException:
-                self.logger.debug("Kein Bearbeiten-Button gefunden, versuche Doppelklick auf Regel")
-                # Versuche Doppelklick auf die Regel
-                try:
-                    from selenium.webdriver.common.action_chains import ActionChains
-
-                    rule_element = self._wait_and_find(
-                        By.XPATH, f"//*[contains(text(), '{rule_name}')]", timeout=5
-                    )
-                    ActionChains(self.driver).double_click(rule_element).perform()
-                    time.sleep(2)
-                except Exception:
-                    pass
-
-            # Debug: Screenshot nach Regel-Bearbeitung
-            try:
-                self.driver.save_screenshot("debug_rule_edit.png")
-                with open("debug_rule_edit.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                self.logger.debug("Regel-Bearbeitung-Debug gespeichert")
-            except Exception:
-                pass
+            if self._edit_dialog_is_open():
+                # Dialog ist z.B. von open_rule_for_editing noch offen - keine neue Navigation
+                self.logger.debug("Bearbeitungsdialog bereits geöffnet, überspringe Navigation")
+            else:
+                if not self._navigate_to_mail_filter():
+                    self.logger.error("Konnte nicht zu Filterregeln navigieren")
+                    return set()
 
-            # Warte auf das Modal-Fenster mit den Umleitungsfeldern
-            time.sleep(3)
+                self._open_rule_dialog()
 
             # Extrahiere E-Mail-Adressen aus den Umleitungs-Input-Feldern
             # Die Felder haben IDs wie redirect_601, redirect_607, etc.
             try:
-                redirect_inputs = self.driver.find_elements(
-                    By.CSS_SELECTOR, 'input[id^="redirect_"], input[name="to"]'
-                )
-                self.logger.debug(f"{len(redirect_inputs)} Umleitungs-Eingabefelder gefunden")
-
-                for input_field in redirect_inputs:
-                    try:
-                        value = input_field.get_attribute("value")
-                        if value and "@" in value:
-                            email_lower = value.lower().strip()
-                            # Ignoriere die eigene Address
-                            if email_lower != self.config.email.lower():
-                                emails.add(email_lower)
+                self._wait_present(By.CSS_SELECTOR, REDIRECT_INPUT_CSS, timeout=10)
+                # Alle Werte mit einem einzigen Script-Aufruf lesen statt get_attribute pro Feld
+                values = self.driver.execute_script(READ_INPUT_VALUES_JS, REDIRECT_INPUT_CSS)
+                self.logger.debug(f"{len(values)} Umleitungs-Eingabefelder gefunden")
+                # Dialog bleibt offen, damit anschließendes Bearbeiten ihn weiterverwenden kann
+                self._edit_dialog_open = bool(values)
+                if not values:
+                    self._dump_debug("rule_edit")
+
+                own_email = self.config.email.lower()
+                debug = self.logger.isEnabledFor(logging.DEBUG)
+                for value in values:
+                    if value and "@" in value:
+                        email_lower = value.lower().strip()
+                        # Ignoriere die eigene Address
+                        if email_lower != own_email:
+                            emails.add(email_lower)
+                            if debug:
                                 self.logger.debug(f"Umleitungsadresse gefunden: {email_lower}")
-                    except Exception:
-                        continue
             except Exception as e:
                 self.logger.debug(f"Fehler beim Lesen der Input-Felder: {e}")
 
             self.logger.info(f"{len(emails)} Weiterleitungsadressen gefunden")
 
-            # Schließe den Dialog wenn often
+        except Exception as e:
+            self.logger.error(f"Fehler beim Lesen der Weiterleitungen: {e}")
+            self._dump_debug("rule_edit_error")
+
+        return emails
+
+    def _open_rule_dialog(self):
+        """Wählt die Filterregel aus und öffnet ihren Bearbeitungsdialog."""
+        # Suche nach der spezifischen Filterregel
+        rule_name = self.config.rule_name
+        self.logger.debug(f"Suche Filterregel: {rule_name}")
+
+        # Find die Regel in der Liste und klicke auf Bearbeiten
+        try:
+            # Method 1: Suche nach dem Regelnamen und klicke darauf
+            rule_element = self._wait_for_rule_item(rule_name)
+            self._safe_click(rule_element)
+            self.logger.debug(f"Regel '{rule_name}' ausgewählt")
+        except TimeoutException:
+            self.logger.warning(f"Regel '{rule_name}' nicht direkt gefunden, durchsuche Seite...")
+
+        # Klicke auf Bearbeiten-Button
+        try:
+            edit_button = self._wait_for_text("button, a", ("Bearbeiten",), timeout=5)
+            self._safe_click(edit_button)
+            self.logger.debug("Bearbeiten-Button geklickt")
+            self._wait_for_edit_dialog()
+        except TimeoutException:
+            self.logger.debug("Kein Bearbeiten-Button gefunden, versuche Doppelklick auf Regel")
+            # Versuche Doppelklick auf die Regel
             try:
-                close_btn = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'button.close, button[aria-label="Schließen"], .modal-header button',
-                )
-                self._safe_click(close_btn)
+                rule_element = self._wait_for_rule_item(rule_name, timeout=5)
+                ActionChains(self.driver).double_click(rule_element).perform()
+                self._wait_for_edit_dialog()
             except Exception:
                 pass
 
-        except Exception as e:
-            self.logger.error(f"Fehler beim Lesen der Weiterleitungen: {e}")
+    def _edit_dialog_is_open(self) -> bool:
+        """Prüft ob der Bearbeitungsdialog der Regel noch geöffnet ist."""
+        return self._edit_dialog_open and bool(
+            self.driver.find_elements(By.CSS_SELECTOR, REDIRECT_INPUT_CSS)
+        )
 
-        return emails
+    def _close_edit_dialog(self):
+        """Schließt den Bearbeitungsdialog ohne zu speichern."""
+        try:
+            close_btn = self.driver.find_element(By.CSS_SELECTOR, CLOSE_DIALOG_CSS)
+            self._safe_click(close_btn)
+        except Exception:
+            pass
+        self._edit_dialog_open = False
 
     def open_rule_for_editing(self) -> bool:
         """
@@ -543,49 +1035,41 @@ class StratoSeleniumClient:
         """
         self.logger.info(f"Öffne Regel '{self.config.rule_name}' zur Bearbeitung...")
 
+        if not self._ensure_connected():
+            return False
+
+        if self._edit_dialog_is_open():
+            self.logger.debug("Regel ist bereits zur Bearbeitung geöffnet")
+            return True
+
         try:
             if not self._navigate_to_mail_filter():
                 return False
 
-            time.sleep(2)
-
             rule_name = self.config.rule_name
 
             # Find die Regel und klicke darauf
             try:
-                rule_element = self._wait_and_find(
-                    By.XPATH,
-                    f"//div[contains(@class, 'rule') or contains(@class, 'list-item')]//span[contains(text(), '{rule_name}')] | //li[contains(text(), '{rule_name}')]",
-                    timeout=10,
-                )
+                rule_element = self._wait_for_rule_item(rule_name)
                 self._safe_click(rule_element)
-                time.sleep(1)
             except TimeoutException:
                 self.logger.warning(f"Regel '{rule_name}' nicht direkt gefunden")
 
             # Klicke auf Bearbeiten-Button
             try:
-                edit_button = self._wait_and_find(
-                    By.XPATH,
-                    "//button[contains(text(), 'Bearbeiten')] | //a[contains(text(), 'Bearbeiten')] | //button[contains(@aria-label, 'Bearbeiten')]",
-                    timeout=5,
-                    clickable=True,
-                )
+                edit_button = self._wait_for_text("button, a", ("Bearbeiten",), timeout=5)
                 self._safe_click(edit_button)
-                time.sleep(2)
+                self._wait_for_edit_dialog()
                 self.logger.debug("Regel zur Bearbeitung geöffnet")
+                self._edit_dialog_open = True
                 return True
             except TimeoutException:
                 # Versuche Doppelklick
                 try:
-                    from selenium.webdriver.common.action_chains import ActionChains
-
-                    rule_element = self._wait_and_find(
-                        By.XPATH, f"//*[contains(text(), '{rule_name}')]", timeout=5
-                    )
+                    rule_element = self._wait_for_rule_item(rule_name, timeout=5)
                     ActionChains(self.driver).double_click(rule_element).perform()
-                    time.sleep(2)
-                    return True
+                    self._edit_dialog_open = self._wait_for_edit_dialog()
+                    return self._edit_dialog_open
                 except Exception:
                     pass
 
@@ -602,81 +1086,46 @@ class StratoSeleniumClient:
         Returns:
             True wenn ein neues Feld erstellt wurde
         """
-        # Verschiedene Selektoren für den "Aktion hinzufügen"-Button ausprobieren
-        add_button_selectors = [
-            "//button[contains(text(), 'Aktion hinzufügen')]",
-            "//a[contains(text(), 'Aktion hinzufügen')]",
-            "//button[@data-action='add-action']",
-            "//button[contains(text(), 'Add action')]",
-            "//a[contains(text(), 'Add action')]",
-            "//button[contains(@class, 'add-action')]",
-            "//a[contains(@class, 'add-action')]",
-            "//*[contains(@class, 'add') and contains(@class, 'action')]",
-            "//button[contains(text(), '+')]",
-            "//*[@data-action='add']",
-        ]
-
-        add_button = None
-        for selector in add_button_selectors:
-            buttons = self.driver.find_elements(By.XPATH, selector)
-            if buttons:
-                add_button = buttons[0]
-                self.logger.debug(f"'Aktion hinzufügen'-Button gefunden mit Selektor: {selector}")
-                break
+        # Alle Varianten des "Aktion hinzufügen"-Buttons in einem Script-Aufruf prüfen
+        add_button = self.driver.execute_script(FIND_ADD_BUTTON_JS)
 
         if not add_button:
             self.logger.warning("Kein 'Aktion hinzufügen'-Button gefunden")
             return False
 
-        # Button klicken
+        self.logger.debug("'Aktion hinzufügen'-Button gefunden")
+
+        # Button klicken und warten bis ein zusätzliches Umleitungsfeld erscheint
+        fields_before = len(self.driver.find_elements(By.CSS_SELECTOR, REDIRECT_INPUT_CSS))
         self._safe_click(add_button)
-        time.sleep(1.5)
+        try:
+            self._wait(5).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, REDIRECT_INPUT_CSS)) > fields_before
+            )
+        except TimeoutException:
+            self.logger.debug("Kein neues Umleitungsfeld erschienen, prüfe Aktions-Dropdown...")
 
         # Versuche "Umleiten nach" als Action auszuwählen
         try:
-            # Verschiedene Selektoren für das Dropdown
-            dropdown_selectors = [
-                'select[name="actioncontent"]',
-                ".action-select",
-                "select.form-control",
-                'select[name*="action"]',
-                'select[id*="action"]',
-            ]
-
-            action_dropdown = None
-            for selector in dropdown_selectors:
-                try:
-                    action_dropdown = self._wait_and_find(By.CSS_SELECTOR, selector, timeout=3)
-                    if action_dropdown:
-                        break
-                except Exception:
-                    continue
+            # Alle Dropdown-Selektoren in einer Abfrage (statt bis zu 3s Wartezeit je Selektor)
+            try:
+                action_dropdown = self._wait_and_find(
+                    By.CSS_SELECTOR, ACTION_DROPDOWN_CSS, timeout=3
+                )
+            except TimeoutException:
+                action_dropdown = None
 
             if action_dropdown:
-                from selenium.webdriver.support.ui import Select
-
-                select = Select(action_dropdown)
-
-                # Versuche verschiedene Werte für "redirect"
-                redirect_values = [
-                    "redirect",
-                    "Redirect",
-                    "umleiten",
-                    "Umleiten",
-                    "forward",
-                    "Forward",
-                ]
-                for value in redirect_values:
-                    try:
-                        select.select_by_value(value)
-                        self.logger.debug(f"Aktions-Dropdown auf '{value}' gesetzt")
-                        break
-                    except Exception:
-                        continue
+                # Passende Option im Browser suchen und setzen: ein Aufruf statt eines
+                # fehlschlagenden select_by_value pro Kandidat
+                value = self.driver.execute_script(
+                    SELECT_OPTION_BY_VALUE_JS, action_dropdown, list(REDIRECT_ACTION_VALUES)
+                )
+                if value:
+                    self.logger.debug(f"Aktions-Dropdown auf '{value}' gesetzt")
         except Exception as e:
             self.logger.debug(f"Konnte Aktions-Dropdown nicht konfigurieren: {e}")
 
-        time.sleep(1)
         return True
 
     def add_forwarding_address(self, email: str) -> bool:
@@ -689,34 +1138,124 @@ class StratoSeleniumClient:
         Returns:
             True bei Erfolg
         """
-        self.logger.info(f"Füge Weiterleitung hinzu: {email}")
+        return bool(self.add_forwarding_addresses([email]))
+
+    def add_forwarding_addresses(self, emails: List[str]) -> List[str]:
+        """
+        Fügt mehrere Weiterleitungsadressen in einem Durchgang zur Filterregel hinzu.
+
+        Fehlende Umleitungsfelder werden gesammelt angelegt und alle Adressen mit einem
+        einzigen Script-Aufruf eingetragen. Klappt das nicht, werden die übrigen Adressen
+        einzeln eingetragen.
+
+        Args:
+            emails: E-Mail-Adressen für die Weiterleitung
+
+        Returns:
+            Liste der erfolgreich eingetragenen Adressen
+        """
+        if not emails:
+            return []
+
+        self.logger.info(f"Füge {len(emails)} Weiterleitung(en) hinzu...")
+
+        if not self._ensure_edit_dialog():
+            return []
 
         try:
-            # Verschiedene Selektoren für Umleitungs-Input-Felder
-            input_selectors = [
-                'input[id^="redirect_"]',
-                'input[name="to"]',
-                'input[name*="redirect"]',
-                'input[type="email"]',
-                'input[placeholder*="@"]',
-                'input[placeholder*="mail"]',
-            ]
+            filled = self._fill_redirect_fields_batch(emails)
+        except Exception as e:
+            self.logger.debug(f"Gesammeltes Eintragen fehlgeschlagen, trage einzeln ein: {e}")
+            filled = 0
+
+        added = list(emails[:filled])
+        for email in emails[filled:]:
+            if self._add_single_forwarding_address(email):
+                added.append(email)
+        return added
 
+    def _fill_redirect_fields_batch(self, emails: List[str]) -> int:
+        """
+        Legt fehlende Umleitungsfelder an und füllt leere Felder mit einem Script-Aufruf.
+
+        Returns:
+            Anzahl der eingetragenen Adressen (in Reihenfolge von emails)
+        """
+        empty_count = self.driver.execute_script(COUNT_EMPTY_FIELDS_JS, REDIRECT_INPUT_CSS)
+        missing = len(emails) - empty_count
+        removes_before = None
+
+        if missing > 0:
+            removes_before = len(self.driver.find_elements(By.CSS_SELECTOR, REMOVE_ACTION_CSS))
+            try:
+                for _ in range(missing):
+                    self._add_redirect_row()
+            except (NoSuchElementException, TimeoutException):
+                # Leere Zeilen nicht im ungespeicherten Regel-Dialog zurücklassen
+                self._remove_unused_actions(removes_before)
+                raise
+            self.logger.debug(f"{missing} Umleitungsfelder angelegt")
+
+        filled = self.driver.execute_script(FILL_EMPTY_FIELDS_JS, REDIRECT_INPUT_CSS, emails)
+        self.logger.debug(f"{filled} Adressen gesammelt eingetragen")
+        if filled < len(emails) and removes_before is not None:
+            # Übrige Adressen legt der Einzelweg selbst an
+            self._remove_unused_actions(removes_before)
+        return int(filled)
+
+    def _add_redirect_row(self):
+        """
+        Fügt eine Aktionszeile hinzu, stellt sie auf "Umleiten" und wartet auf ihr Eingabefeld.
+
+        Der Button wird pro Zeile neu gesucht, da OX die Aktionsliste nach jedem Klick neu
+        rendern kann.
+
+        Raises:
+            NoSuchElementException: Wenn kein "Aktion hinzufügen"-Button vorhanden ist
+            TimeoutException: Wenn die neue Zeile oder ihr Umleitungsfeld nicht erscheint
+        """
+        add_button = self.driver.execute_script(FIND_ADD_BUTTON_JS)
+        if not add_button:
+            raise NoSuchElementException("Kein 'Aktion hinzufügen'-Button gefunden")
+
+        fields_before = len(self.driver.find_elements(By.CSS_SELECTOR, REDIRECT_INPUT_CSS))
+        selects_before = len(self.driver.find_elements(By.CSS_SELECTOR, ACTION_DROPDOWN_CSS))
+        self.driver.execute_script("arguments[0].click();", add_button)
+
+        # Neue Zeile: entweder direkt ein Umleitungsfeld oder ein weiteres Aktions-Dropdown
+        self._wait(5).until(
+            lambda d: (
+                len(d.find_elements(By.CSS_SELECTOR, REDIRECT_INPUT_CSS)) > fields_before
+                or len(d.find_elements(By.CSS_SELECTOR, ACTION_DROPDOWN_CSS)) > selects_before
+            )
+        )
+        selects = self.driver.find_elements(By.CSS_SELECTOR, ACTION_DROPDOWN_CSS)
+        if len(selects) > selects_before:
+            # Neue Zeilen werden angehängt, ihr Dropdown ist also das letzte
+            self.driver.execute_script(
+                SELECT_OPTION_BY_VALUE_JS, selects[-1], list(REDIRECT_ACTION_VALUES)
+            )
+        self._wait(5).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, REDIRECT_INPUT_CSS)) > fields_before
+        )
+
+    def _remove_unused_actions(self, start: int):
+        """Entfernt ab Index start angelegte Aktionszeilen, deren Umleitungsfeld leer ist."""
+        removed = self.driver.execute_script(
+            REMOVE_UNUSED_ACTIONS_JS, REMOVE_ACTION_CSS, REDIRECT_INPUT_CSS, start
+        )
+        if removed:
+            self.logger.debug(f"{removed} ungenutzte Aktionszeilen entfernt")
+
+    def _add_single_forwarding_address(self, email: str) -> bool:
+        """Trägt eine einzelne Adresse in ein (ggf. neu angelegtes) Umleitungsfeld ein."""
+        self.logger.debug(f"Füge Weiterleitung einzeln hinzu: {email}")
+
+        try:
+            # Leeres Umleitungsfeld über die Selektorliste suchen
             def find_empty_redirect_field():
-                """Sucht ein leeres Umleitungsfeld."""
-                for selector in input_selectors:
-                    redirect_inputs = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    # Von hinten beginnen (neueste zuerst)
-                    for field in reversed(redirect_inputs):
-                        try:
-                            value = field.get_attribute("value")
-                            if not value or value.strip() == "":
-                                # Prüfen ob das Feld sichtbar und interaktiv ist
-                                if field.is_displayed() and field.is_enabled():
-                                    return field
-                        except Exception:
-                            continue
-                return None
+                """Sucht ein leeres, sichtbares Umleitungsfeld (neueste zuerst) im Browser."""
+                return self.driver.execute_script(FIND_EMPTY_FIELD_JS, REDIRECT_INPUT_SELECTORS)
 
             # Erst nach leerem Feld suchen
             empty_field = find_empty_redirect_field()
@@ -727,43 +1266,18 @@ class StratoSeleniumClient:
 
                 if self._create_new_redirect_field():
                     # Nach dem Erstellen erneut nach leerem Feld suchen
-                    time.sleep(0.5)
                     empty_field = find_empty_redirect_field()
 
                     if not empty_field:
                         self.logger.debug(
                             "Suche nach neu erstelltem Feld mit erweiterten Selektoren..."
                         )
-                        # Nochmals mit allen Input-Feldern versuchen
-                        all_inputs = self.driver.find_elements(
-                            By.CSS_SELECTOR,
-                            'input[type="text"], input[type="email"], input:not([type])',
-                        )
-                        for field in reversed(all_inputs):
-                            try:
-                                value = field.get_attribute("value")
-                                field_id = field.get_attribute("id") or ""
-                                field_name = field.get_attribute("name") or ""
-                                # Prüfen ob es ein Redirect-Feld sein könnte
-                                if (
-                                    (not value or value.strip() == "")
-                                    and field.is_displayed()
-                                    and field.is_enabled()
-                                ):
-                                    if (
-                                        "redirect" in field_id.lower()
-                                        or "redirect" in field_name.lower()
-                                        or "to" in field_name.lower()
-                                    ):
-                                        empty_field = field
-                                        break
-                            except Exception:
-                                continue
+                        # Nochmals mit allen Input-Feldern versuchen (im Browser geprüft)
+                        empty_field = self.driver.execute_script(FIND_REDIRECT_LIKE_FIELD_JS)
 
             if empty_field:
                 self._safe_send_keys(empty_field, email)
                 self.logger.debug(f"E-Mail-Adresse eingegeben: {email}")
-                time.sleep(0.3)  # Kurze Pause nach Eingabe
                 return True
             else:
                 self.logger.warning("Kein leeres Umleitungsfeld gefunden")
@@ -785,22 +1299,15 @@ class StratoSeleniumClient:
         """
         self.logger.info(f"Entferne Weiterleitung: {email}")
 
+        if not self._ensure_edit_dialog():
+            return False
+
         try:
-            # Find das Input-Feld mit der zu entfernenden Address
-            redirect_inputs = self.driver.find_elements(
-                By.CSS_SELECTOR, 'input[id^="redirect_"], input[name="to"]'
+            # Find das Input-Feld mit der zu entfernenden Address (Vergleich im Browser)
+            target_field = self.driver.execute_script(
+                FIND_FIELD_BY_VALUE_JS, REDIRECT_INPUT_CSS, email.lower().strip()
             )
 
-            target_field = None
-            for field in redirect_inputs:
-                try:
-                    value = field.get_attribute("value")
-                    if value and value.lower().strip() == email.lower().strip():
-                        target_field = field
-                        break
-                except Exception:
-                    continue
-
             if not target_field:
                 self.logger.warning(f"Weiterleitungsadresse nicht gefunden: {email}")
                 return False
@@ -812,13 +1319,10 @@ class StratoSeleniumClient:
             )
 
             try:
-                remove_btn = parent.find_element(
-                    By.CSS_SELECTOR,
-                    'button[data-action="remove-action"], button.remove, button[aria-label*="Entfernen"]',
-                )
+                remove_btn = parent.find_element(By.CSS_SELECTOR, REMOVE_ACTION_CSS)
                 self._safe_click(remove_btn)
                 self.logger.debug(f"Entfernen-Button geklickt für: {email}")
-                time.sleep(0.5)
+                self._wait_until_removed(target_field, timeout=2)
                 return True
             except NoSuchElementException:
                 self.logger.warning(f"Entfernen-Button nicht gefunden für: {email}")
@@ -839,31 +1343,16 @@ class StratoSeleniumClient:
 
         try:
             # OPTIMIERT: Funktionierende Selektoren zuerst, keine Debug-Screenshots
-            save_button_selectors = [
-                (By.XPATH, "//button[contains(text(), 'Speichern')]"),  # Funktioniert!
-                (By.XPATH, "//a[contains(text(), 'Speichern')]"),
-                (By.CSS_SELECTOR, 'button[data-action="save"]'),
-                (By.CSS_SELECTOR, "button.btn-primary"),
-            ]
-
-            save_button = None
-            for by, selector in save_button_selectors:
-                try:
-                    buttons = self.driver.find_elements(by, selector)
-                    for btn in buttons:
-                        if btn.is_displayed() and btn.is_enabled():
-                            save_button = btn
-                            self.logger.debug(f"Speichern-Button gefunden mit: {selector}")
-                            break
-                    if save_button:
-                        break
-                except Exception:
-                    continue
-
+            save_button = self._find_first_visible(SAVE_BUTTON_SELECTORS)
             if save_button:
                 self._safe_click(save_button)
                 self.logger.debug("Speichern-Button geklickt")
-                time.sleep(1.5)
+                self._edit_dialog_open = False
+                # Warten bis der Dialog geschlossen ist statt fester Pause
+                try:
+                    self._wait(10).until(EC.invisibility_of_element(save_button))
+                except TimeoutException:
+                    self.logger.debug("Speichern-Button nach 10s noch sichtbar")
                 return True
 
             self.logger.warning("Speichern-Button nicht gefunden")
@@ -886,9 +1375,8 @@ class StratoSeleniumClient:
         Returns:
             Set mit E-Mail-Adressen die durch Regeln verwaltet werden
         """
-        if not self._logged_in:
-            if not self.connect():
-                return set()
+        if not self._ensure_connected():
+            return set()
 
         emails: Set[str] = set()
         prefix = self.config.rule_prefix
@@ -899,79 +1387,22 @@ class StratoSeleniumClient:
                 self.logger.error("Konnte nicht zu Filterregeln navigieren")
                 return set()
 
-            time.sleep(2)
-
-            # Debug: Screenshot der Filterregeln-Seite
-            try:
-                self.driver.save_screenshot("debug_rules_list.png")
-                self.logger.debug("Screenshot der Regelliste gespeichert")
-            except Exception:
-                pass
-
-            # Versuche verschiedene Selektoren für die Regelliste
-            all_found_texts = []
-
-            # Methode 1: CSS Selektoren
-            rule_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                '.rule-list li, .settings-list-view li, [data-type="rule"], .list-item, .listbox li',
-            )
-            self.logger.debug(f"CSS-Selektoren: {len(rule_elements)} Elemente gefunden")
-
-            for rule_el in rule_elements:
-                try:
-                    rule_name = rule_el.text.strip()
-                    if rule_name:
-                        all_found_texts.append(f"CSS: '{rule_name[:50]}...'")
-                        # Prüfe ob der Name mit unserem Prefix beginnt
-                        if rule_name.startswith(prefix):
-                            email = rule_name[len(prefix) :].lower().strip()
-                            # Nur erste Zeile (falls mehrzeilig)
-                            email = email.split("\n")[0].strip()
-                            if "@" in email:
-                                emails.add(email)
-                                self.logger.debug(f"✓ Regel gefunden: '{rule_name}' -> '{email}'")
-                except Exception:
-                    continue
-
-            # Methode 2: XPath für Spans/Divs mit dem Prefix
-            rule_spans = self.driver.find_elements(
-                By.XPATH,
-                f"//span[starts-with(text(), '{prefix}')] | //div[starts-with(text(), '{prefix}')] | //*[contains(text(), '{prefix}')]",
-            )
-            self.logger.debug(f"XPath prefix-Suche: {len(rule_spans)} Elemente gefunden")
-
-            for span in rule_spans:
-                try:
-                    rule_name = span.text.strip()
-                    if rule_name and rule_name.startswith(prefix):
-                        all_found_texts.append(f"XPATH: '{rule_name[:50]}...'")
-                        email = rule_name[len(prefix) :].lower().strip()
-                        email = email.split("\n")[0].strip()
-                        if "@" in email:
-                            emails.add(email)
-                            self.logger.debug(
-                                f"✓ Regel gefunden (XPath): '{rule_name}' -> '{email}'"
-                            )
-                except Exception:
-                    continue
-
-            # Methode 3: Alle li-Elemente in der Seite prüfen
-            all_li = self.driver.find_elements(By.TAG_NAME, "li")
-            self.logger.debug(f"Alle li-Elemente: {len(all_li)} gefunden")
-            for li in all_li:
-                try:
-                    li_text = li.text.strip()
-                    if li_text and prefix in li_text:
-                        self.logger.debug(f"  li mit Prefix: '{li_text[:80]}...'")
-                        # Extrahiere E-Mail wenn möglich
-                        if li_text.startswith(prefix):
-                            email = li_text[len(prefix) :].lower().strip()
-                            email = email.split("\n")[0].strip()
-                            if "@" in email:
-                                emails.add(email)
-                except Exception:
-                    continue
+            # Auf die Regelliste warten (sie wird nachgeladen), dann alle Texte mit einem
+            # einzigen Script-Aufruf einsammeln statt .text pro Element abzufragen
+            self._wait_present(By.CSS_SELECTOR, RULE_LIST_CSS, timeout=10)
+            # Log-Level einmal prüfen statt Debug-Texte pro Regel umsonst zu formatieren
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            found = self.driver.execute_script(COLLECT_RULE_NAMES_JS, prefix, RULE_LIST_CSS, debug)
+            if debug:
+                self.logger.debug(f"{len(found['rules'])} Regelnamen mit Prefix gefunden")
+
+            for rule_name in found["rules"]:
+                # Nur erste Zeile (falls mehrzeilig)
+                email = rule_name[len(prefix) :].lower().strip().split("\n")[0].strip()
+                if "@" in email:
+                    emails.add(email)
+                    if debug:
+                        self.logger.debug(f"✓ Regel gefunden: '{rule_name}' -> '{email}'")
 
             self.logger.info(
                 f"{len(emails)} verwaltete E-Mail-Regeln gefunden (Prefix: '{prefix}')"
@@ -980,7 +1411,9 @@ class StratoSeleniumClient:
                 self.logger.debug(f"Gefundene E-Mails: {sorted(emails)}")
             else:
                 self.logger.warning(f"Keine Regeln mit Prefix '{prefix}' gefunden!")
-                self.logger.debug(f"Gefundene Texte (erste 10): {all_found_texts[:10]}")
+                self._dump_debug("rules_list", html=False)
+                if found["sample"]:
+                    self.logger.debug(f"Gefundene Texte (erste 10): {found['sample']}")
 
         except Exception as e:
             self.logger.error(f"Fehler beim Lesen der Regeln: {e}")
@@ -1000,116 +1433,93 @@ class StratoSeleniumClient:
         Returns:
             True bei Erfolg
         """
-        rule_name = f"{self.config.rule_prefix}{email}"
-        self.logger.info(f"Erstelle neue Regel: {rule_name}")
+        if not self._ensure_connected() or not self._navigate_to_mail_filter():
+            return False
+        return self._create_rule_from_filter_page(email)
 
-        try:
-            if not self._navigate_to_mail_filter():
-                return False
+    def create_individual_rules_bulk(self, emails: Iterable[str]) -> List[str]:
+        """
+        Erstellt individuelle Filterregeln für mehrere E-Mail-Adressen.
 
-            time.sleep(2)
+        Die Filterregeln-Seite wird nur einmal geöffnet; nach dem Speichern einer Regel
+        bleibt der Browser auf der Regelliste, sodass die nächste Regel direkt folgt.
 
-            # Debug-Screenshot vor Suche nach "Neue Regel"-Button
-            try:
-                self.driver.save_screenshot("debug_before_new_rule.png")
-            except Exception:
-                pass
+        Args:
+            emails: E-Mail-Adressen, für die je eine Regel erstellt wird
 
-            # Suche den "Neue Regel erstellen" Button - verschiedene Selektoren
-            new_rule_buttons = []
-            # OPTIMIERT: Funktionierende Selektoren zuerst
-            add_rule_selectors = [
-                (By.XPATH, "//button[contains(text(), 'Neue Regel')]"),  # Funktioniert!
-                (By.XPATH, "//a[contains(text(), 'Neue Regel')]"),
-                (By.CSS_SELECTOR, '[data-action="io.ox/mail/mailfilter/settings/filter/add"]'),
-                (By.XPATH, "//button[contains(text(), 'Add new rule')]"),
-            ]
-
-            for by, selector in add_rule_selectors:
-                try:
-                    elements = self.driver.find_elements(by, selector)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            new_rule_buttons = [elem]
-                            self.logger.debug(f"'Neue Regel'-Button gefunden mit: {selector}")
-                            break
-                    if new_rule_buttons:
-                        break
-                except Exception:
-                    continue
+        Returns:
+            Liste der Adressen, deren Regel erstellt wurde
+        """
+        created = []
+        for email in emails:
+            if not self._ensure_connected() or not self._navigate_to_mail_filter():
+                break
+            if self._create_rule_from_filter_page(email):
+                created.append(email)
+        return created
+
+    def _create_rule_from_filter_page(self, email: str) -> bool:
+        """
+        Erstellt eine Regel, ausgehend von der bereits geöffneten Filterregeln-Seite.
+
+        Args:
+            email: E-Mail-Adresse für die Weiterleitung
+
+        Returns:
+            True bei Erfolg
+        """
+        rule_name = f"{self.config.rule_prefix}{email}"
+        self.logger.info(f"Erstelle neue Regel: {rule_name}")
 
-            if not new_rule_buttons:
+        # Schlägt die Erstellung fehl, kann ein halb ausgefüllter Dialog offen bleiben
+        self._filter_page_at = 0.0
+        try:
+            # Suche den "Neue Regel erstellen" Button - verschiedene Selektoren
+            # Alle Varianten in einer Abfrage pro Poll, statt erst 10s auf die erste zu warten
+            new_rule_button = self._wait_first_visible(ADD_RULE_SELECTORS, timeout=10)
+            if not new_rule_button:
                 self.logger.error("Konnte 'Neue Regel erstellen'-Button nicht finden")
-                # Debug-Screenshot
-                try:
-                    self.driver.save_screenshot("debug_no_add_button.png")
-                    with open("debug_no_add_button.html", "w", encoding="utf-8") as f:
-                        f.write(self.driver.page_source)
-                except Exception:
-                    pass
+                self._dump_debug("no_add_button")
                 return False
 
-            self._safe_click(new_rule_buttons[0])
-            time.sleep(2)  # Zeit für das Modal
+            self._safe_click(new_rule_button)
 
-            # Jetzt sind wir im Regel-Bearbeitungsdialog
+            # Jetzt sind wir im Regel-Bearbeitungsdialog - warten bis das Namensfeld sichtbar ist
             # 1. Regelnamen setzen - OPTIMIERT: Funktionierende Selektoren zuerst
-            name_input = None
-            name_selectors = [
-                (By.CSS_SELECTOR, 'input[name="rulename"]'),  # Funktioniert!
-                (By.XPATH, "//input[@name='rulename']"),
-                (By.CSS_SELECTOR, 'input[id*="rulename"]'),
-            ]
-
-            for by, selector in name_selectors:
-                try:
-                    elements = self.driver.find_elements(by, selector)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            name_input = elem
-                            self.logger.debug(f"Namensfeld gefunden mit Selektor: {selector}")
-                            break
-                    if name_input:
-                        break
-                except Exception:
-                    continue
-
+            name_input = self._wait_first_visible(RULE_NAME_SELECTORS, timeout=10)
             if not name_input:
-                self.logger.error("Kein Namensfeld gefunden - prüfe debug_new_rule_dialog.png/html")
+                self.logger.error("Kein Namensfeld gefunden (Details mit --debug)")
+                self._dump_debug("new_rule_dialog")
                 # Liste alle sichtbaren Input-Felder auf
-                all_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input")
-                self.logger.debug(f"Gefundene Input-Felder: {len(all_inputs)}")
-                for i, inp in enumerate(all_inputs[:10]):
-                    try:
+                # Diagnose kostet einen Browser-Aufruf, daher nur bei aktivem Debug-Logging
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # Alle Attribute mit einem Script-Aufruf lesen statt vier Aufrufen pro Feld
+                    count, inputs = self.driver.execute_script(DESCRIBE_INPUTS_JS, 10)
+                    self.logger.debug(f"Gefundene Input-Felder: {count}")
+                    for i, (input_type, name, input_id, visible) in enumerate(inputs):
                         self.logger.debug(
-                            f"  Input {i}: type={inp.get_attribute('type')}, "
-                            f"name={inp.get_attribute('name')}, "
-                            f"id={inp.get_attribute('id')}, "
-                            f"visible={inp.is_displayed()}"
+                            f"  Input {i}: type={input_type}, name={name}, id={input_id}, "
+                            f"visible={visible}"
                         )
-                    except Exception:
-                        pass
                 return False
 
             try:
-                name_input.clear()
+                # Kein clear() nötig: _safe_send_keys ersetzt den Wert vollständig
                 self._safe_send_keys(name_input, rule_name)
                 self.logger.debug(f"Regelname gesetzt: {rule_name}")
             except Exception as e:
                 self.logger.error(f"Konnte Regelnamen nicht setzen: {e}")
                 return False
 
-            time.sleep(0.5)
-
             # 2. Aktion hinzufügen: Umleiten
             if not self._add_redirect_action_to_new_rule(email):
                 self.logger.error("Konnte Umleitungsaktion nicht hinzufügen")
                 return False
 
-            # 3. Speichern
-            time.sleep(1)
+            # 3. Speichern (danach zeigt der Browser wieder die Regelliste)
             if self.save_changes():
                 self.logger.info(f"✅ Regel erstellt: {rule_name}")
+                self._filter_page_at = time.monotonic()
                 return True
             else:
                 self.logger.error("Konnte Regel nicht speichern")
@@ -1126,126 +1536,76 @@ class StratoSeleniumClient:
         """
         try:
             # Finde den Aktionen-Bereich (legend.actions -> parent fieldset)
-            actions_fieldset = None
-            for by, selector in [
-                (By.XPATH, "//legend[contains(@class, 'actions')]/parent::fieldset"),
-                (By.XPATH, "//legend[contains(text(), 'Aktion')]/parent::fieldset"),
-            ]:
-                try:
-                    elements = self.driver.find_elements(by, selector)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            actions_fieldset = elem
-                            break
-                    if actions_fieldset:
-                        break
-                except Exception:
-                    continue
+            actions_fieldset = self._find_first_visible(ACTIONS_FIELDSET_SELECTORS)
 
-            # Klicke "Aktion hinzufügen"
-            add_action_clicked = False
-            if actions_fieldset:
-                try:
-                    for link in actions_fieldset.find_elements(By.TAG_NAME, "a"):
-                        link_text = link.text.strip().lower()
-                        if "aktion" in link_text and "hinzufügen" in link_text:
-                            if link.is_displayed() and link.is_enabled():
-                                self._safe_click(link)
-                                self.logger.debug("'Aktion hinzufügen' geklickt")
-                                add_action_clicked = True
-                                time.sleep(1)
-                                break
-                except Exception:
-                    pass
-
-            if not add_action_clicked:
-                # Fallback: Suche global
-                for link in self.driver.find_elements(
-                    By.XPATH, "//a[contains(text(), 'Aktion hinzufügen')]"
-                ):
-                    if link.is_displayed() and link.is_enabled():
-                        self._safe_click(link)
-                        add_action_clicked = True
-                        time.sleep(1)
-                        break
-
-            if not add_action_clicked:
+            # Klicke "Aktion hinzufügen" (danach auf den neuen Dropdown-Toggle der Aktion warten);
+            # der Link im Aktionen-Bereich wird bevorzugt, sonst global gesucht - eine Abfrage
+            toggles_before = len(self.driver.find_elements(By.CSS_SELECTOR, DROPDOWN_TOGGLE_CSS))
+            add_action_link = self._find_first_visible(ADD_ACTION_LINK_SELECTORS)
+            if not add_action_link:
                 self.logger.warning("Kein 'Aktion hinzufügen'-Button gefunden")
                 return False
+            self._safe_click(add_action_link)
+            self.logger.debug("'Aktion hinzufügen' geklickt")
 
-            # Aktualisiere Aktionen-Bereich nach Klick
-            actions_fieldset = None
-            for by, selector in [
-                (By.XPATH, "//legend[contains(@class, 'actions')]/parent::fieldset"),
-                (By.XPATH, "//legend[contains(text(), 'Aktion')]/parent::fieldset"),
-            ]:
-                try:
-                    elements = self.driver.find_elements(by, selector)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            actions_fieldset = elem
-                            break
-                    if actions_fieldset:
-                        break
-                except Exception:
-                    continue
+            try:
+                self._wait(5).until(
+                    lambda d: (
+                        len(d.find_elements(By.CSS_SELECTOR, DROPDOWN_TOGGLE_CSS)) > toggles_before
+                    )
+                )
+            except TimeoutException:
+                self.logger.debug("Kein neuer Dropdown-Toggle nach 'Aktion hinzufügen'")
 
-            # Öffne Dropdown-Toggle im Aktionen-Bereich
-            dropdown_opened = False
+            # Öffne Dropdown-Toggle im Aktionen-Bereich. Der Klick ändert nur dessen Inhalt,
+            # daher wird der Bereich nur neu gesucht, wenn er fehlt oder ersetzt wurde.
+            toggle = None
             if actions_fieldset:
                 try:
-                    for toggle in actions_fieldset.find_elements(
-                        By.CSS_SELECTOR, ".dropdown-toggle"
-                    ):
-                        if toggle.is_displayed() and toggle.is_enabled():
-                            self._safe_click(toggle)
-                            dropdown_opened = True
-                            time.sleep(0.5)
-                            break
-                except Exception:
-                    pass
+                    toggle = self._find_first_visible(
+                        ACTION_TOGGLE_SELECTORS, root=actions_fieldset
+                    )
+                except StaleElementReferenceException:
+                    actions_fieldset = None
+            if not actions_fieldset:
+                actions_fieldset = self._find_first_visible(ACTIONS_FIELDSET_SELECTORS)
+                if actions_fieldset:
+                    toggle = self._find_first_visible(
+                        ACTION_TOGGLE_SELECTORS, root=actions_fieldset
+                    )
 
-            # Wähle "Umleiten nach" aus dem Dropdown
-            redirect_selected = False
-            for by, selector in [
-                (By.CSS_SELECTOR, 'a[data-value="redirect"]'),
-                (By.XPATH, "//a[contains(text(), 'Umleiten nach')]"),
-            ]:
-                try:
-                    for item in self.driver.find_elements(by, selector):
-                        if item.is_displayed():
-                            self._safe_click(item)
-                            self.logger.debug("'Umleiten nach' ausgewählt")
-                            redirect_selected = True
-                            time.sleep(1)
-                            break
-                    if redirect_selected:
-                        break
-                except Exception:
-                    continue
+            dropdown_opened = False
+            if toggle:
+                self._safe_click(toggle)
+                dropdown_opened = True
 
-            if not redirect_selected:
+            # Wähle "Umleiten nach" aus dem Dropdown (sobald das Menü sichtbar ist)
+            if dropdown_opened:
+                try:
+                    self._wait(5).until(
+                        EC.visibility_of_element_located(REDIRECT_MENU_SELECTORS[0])
+                    )
+                except TimeoutException:
+                    pass
+            redirect_item = self._find_first_visible(REDIRECT_MENU_SELECTORS)
+            if redirect_item:
+                self._safe_click(redirect_item)
+                self.logger.debug("'Umleiten nach' ausgewählt")
+            else:
                 self.logger.warning("Konnte 'Umleiten nach' nicht auswählen")
                 self.logger.warning(
                     "⚠️  Möglicherweise wurde das Strato-Limit von 50 Weiterleitungsregeln erreicht!"
                 )
                 return False
 
-            # Finde E-Mail-Eingabefeld
-            for by, selector in [
-                (By.CSS_SELECTOR, 'input[id^="redirect_"]'),
-                (By.CSS_SELECTOR, 'input[id^="redirect"]'),
-                (By.CSS_SELECTOR, 'li.action input[type="text"]'),
-            ]:
-                try:
-                    for field in reversed(self.driver.find_elements(by, selector)):
-                        value = field.get_attribute("value") or ""
-                        if not value.strip() and field.is_displayed() and field.is_enabled():
-                            self._safe_send_keys(field, email)
-                            self.logger.debug(f"Umleitungsadresse eingegeben: {email}")
-                            return True
-                except Exception:
-                    continue
+            # Finde E-Mail-Eingabefeld (erscheint nach der Auswahl)
+            self._wait_present(By.CSS_SELECTOR, NEW_REDIRECT_FIELD_CSS, timeout=5)
+            # Letztes leeres, sichtbares Feld mit einem Script-Aufruf statt Abfragen je Feld
+            field = self.driver.execute_script(FIND_EMPTY_FIELD_JS, NEW_REDIRECT_FIELD_SELECTORS)
+            if field:
+                self._safe_send_keys(field, email)
+                self.logger.debug(f"Umleitungsadresse eingegeben: {email}")
+                return True
 
             self.logger.warning("Kein E-Mail-Feld gefunden")
             return False
@@ -1257,99 +1617,124 @@ class StratoSeleniumClient:
     def delete_individual_rule(self, email: str) -> bool:
         """
         Löscht die individuelle Filterregel für eine E-Mail-Adresse.
+
+        Args:
             email: E-Mail-Adresse deren Regel gelöscht werden soll
 
         Returns:
             True bei Erfolg
         """
-        rule_name = f"{self.config.rule_prefix}{email}"
-        self.logger.info(f"Lösche Regel: {rule_name}")
+        if not self._ensure_connected() or not self._navigate_to_mail_filter():
+            return False
+        return self._delete_rule_from_filter_page(email)
 
-        try:
-            if not self._navigate_to_mail_filter():
-                return False
+    def delete_individual_rules_bulk(self, emails: Iterable[str]) -> List[str]:
+        """
+        Löscht die individuellen Filterregeln mehrerer E-Mail-Adressen.
 
-            time.sleep(2)
+        Die Filterregeln-Seite wird nur einmal geöffnet. Jede Regel wird unmittelbar vor
+        dem Löschen gesucht, da die Liste nach jedem Löschen neu aufgebaut wird und
+        vorab ermittelte Elemente dann ungültig wären.
 
-            # Finde die Regel in der Liste
-            rule_element = None
+        Args:
+            emails: E-Mail-Adressen, deren Regel gelöscht wird
 
-            # Versuche verschiedene Selektoren
-            selectors = [
-                f"//li[contains(text(), '{rule_name}')]",
-                f"//span[contains(text(), '{rule_name}')]/ancestor::li",
-                f"//div[contains(text(), '{rule_name}')]/ancestor::li",
-                f"//*[contains(text(), '{rule_name}')]",
-            ]
+        Returns:
+            Liste der Adressen, deren Regel gelöscht wurde
+        """
+        deleted = []
+        for email in emails:
+            if not self._ensure_connected() or not self._navigate_to_mail_filter():
+                break
+            if self._delete_rule_from_filter_page(email):
+                deleted.append(email)
+        return deleted
+
+    def _delete_rule_from_filter_page(self, email: str) -> bool:
+        """
+        Löscht eine Regel, ausgehend von der bereits geöffneten Filterregeln-Seite.
 
-            for selector in selectors:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                if elements:
-                    rule_element = elements[0]
-                    break
+        Args:
+            email: E-Mail-Adresse deren Regel gelöscht werden soll
+
+        Returns:
+            True bei Erfolg
+        """
+        rule_name = f"{self.config.rule_prefix}{email}"
+        self.logger.info(f"Lösche Regel: {rule_name}")
+
+        # Erst nach erfolgreichem Löschen gilt die Regelliste wieder als geöffnet
+        self._filter_page_at = 0.0
+        try:
+            # Finde die Regel in der Liste (ein Script-Aufruf je Versuch, bis sie geladen ist)
+            try:
+                rule_element = self._wait_for_rule_item(rule_name)
+            except TimeoutException:
+                rule_element = None
 
             if not rule_element:
                 self.logger.warning(f"Regel '{rule_name}' nicht gefunden")
                 return False
 
-            # Klicke auf die Regel um sie auszuwählen
+            # Klicke auf die Regel um sie auszuwählen (und warte auf einen Löschen-Button)
             self._safe_click(rule_element)
-            time.sleep(1)
-
-            # Suche den Löschen-Button
-            delete_buttons = self.driver.find_elements(
-                By.XPATH,
-                "//button[contains(text(), 'Löschen')] | "
-                "//a[contains(text(), 'Löschen')] | "
-                "//button[contains(text(), 'Delete')] | "
-                "//button[contains(text(), 'Entfernen')] | "
-                "//button[@data-action='delete'] | "
-                "//button[@aria-label='Löschen'] | "
-                "//button[contains(@class, 'delete')]",
-            )
+            try:
+                self._wait(3).until(
+                    EC.any_of(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, DELETE_BUTTON_CSS)),
+                        EC.presence_of_element_located((By.XPATH, DELETE_BUTTON_XPATH)),
+                    )
+                )
+            except TimeoutException:
+                pass
 
-            if not delete_buttons:
+            # Suche den Löschen-Button zuerst in der Regelzeile selbst; die globale Suche
+            # (zuerst per CSS, XPath-Textsuche nur als Fallback) nur, wenn die Zeile keinen hat
+            try:
+                delete_button = self._find_first_visible(
+                    DELETE_BUTTON_IN_ROW_SELECTORS, root=rule_element
+                )
+                if not delete_button:
+                    try:
+                        delete_button = self.driver.find_element(By.CSS_SELECTOR, DELETE_BUTTON_CSS)
+                    except NoSuchElementException:
+                        delete_button = self.driver.find_element(By.XPATH, DELETE_BUTTON_XPATH)
+            except NoSuchElementException:
                 # Versuche Kontextmenü
                 try:
-                    from selenium.webdriver.common.action_chains import ActionChains
-
                     ActionChains(self.driver).context_click(rule_element).perform()
-                    time.sleep(0.5)
-
-                    delete_menu = self.driver.find_elements(
-                        By.XPATH,
-                        "//a[contains(text(), 'Löschen')] | //li[contains(text(), 'Löschen')]",
+                    delete_menu = self._wait_and_find(
+                        By.XPATH, DELETE_MENU_XPATH, timeout=5, clickable=True
                     )
-                    if delete_menu:
-                        self._safe_click(delete_menu[0])
-                        time.sleep(1)
-                        self.logger.info(f"✅ Regel gelöscht: {rule_name}")
-                        return True
+                    self._safe_click(delete_menu)
+                    self._wait_until_removed(rule_element)
+                    self.logger.info(f"✅ Regel gelöscht: {rule_name}")
+                    self._filter_page_at = time.monotonic()
+                    return True
                 except Exception:
                     pass
 
                 self.logger.error(f"Konnte Löschen-Button für '{rule_name}' nicht finden")
                 return False
 
-            self._safe_click(delete_buttons[0])
-            time.sleep(1)
+            self._safe_click(delete_button)
 
-            # Bestätige evtl. Bestätigungsdialog
+            # Bestätige evtl. Bestätigungsdialog (oder die Regel ist bereits verschwunden)
             try:
-                confirm_buttons = self.driver.find_elements(
-                    By.XPATH,
-                    "//button[contains(text(), 'OK')] | "
-                    "//button[contains(text(), 'Ja')] | "
-                    "//button[contains(text(), 'Bestätigen')] | "
-                    "//button[contains(text(), 'Delete')]",
+                self._wait(5).until(
+                    EC.any_of(
+                        EC.presence_of_element_located((By.XPATH, CONFIRM_BUTTON_XPATH)),
+                        EC.staleness_of(rule_element),
+                    )
                 )
-                if confirm_buttons:
-                    self._safe_click(confirm_buttons[0])
-                    time.sleep(1)
-            except Exception:
+                confirm_button = self.driver.find_element(By.XPATH, CONFIRM_BUTTON_XPATH)
+                self._safe_click(confirm_button)
+            except (TimeoutException, NoSuchElementException):
                 pass
+            self._wait_until_removed(rule_element)
 
             self.logger.info(f"✅ Regel gelöscht: {rule_name}")
+            self._filter_page_at = time.monotonic()
             return True
 
         except Exception as e:
@@ -1360,11 +1745,20 @@ class StratoSeleniumClient:
         """Beendet den Browser und die Session."""
         if self.driver:
             try:
-                self.driver.quit()
+                if self._attached:
+                    # Nur den Driver beenden, der Browser bleibt für den nächsten Lauf offen
+                    self.driver.service.stop()
+                else:
+                    self.driver.quit()
             except Exception:
                 pass
             self.driver = None
         self._logged_in = False
+        self._attached = False
+        self._edit_dialog_open = False
+        self._filter_page_at = 0.0
+        self._last_screenshot_digest = None
+        self._waits.clear()
         self.logger.debug("Browser geschlossen")
 
     def take_screenshot(self, filename: str = "screenshot.png"):
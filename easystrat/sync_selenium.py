@@ -97,6 +97,10 @@ class SeleniumMailSynchronizer:
                     headless=config.strato_webmail.headless,
                     browser=config.strato_webmail.browser,
                     timeout=config.strato_webmail.timeout,
+                    poll_frequency=config.strato_webmail.poll_frequency,
+                    debugger_address=config.strato_webmail.debugger_address,
+                    profile_dir=config.strato_webmail.profile_dir,
+                    debug_screenshots=config.strato_webmail.debug_screenshots,
                 ),
                 self.logger,
             )
@@ -275,8 +279,10 @@ class SeleniumMailSynchronizer:
         if diff.to_remove:
             if self.config.allow_delete:
                 self.logger.info(f"Lösche {len(diff.to_remove)} Regeln...")
-                for email in diff.to_remove:
-                    if self.strato_client.delete_individual_rule(email):
+                to_remove = sorted(diff.to_remove)
+                deleted_emails = set(self.strato_client.delete_individual_rules_bulk(to_remove))
+                for email in to_remove:
+                    if email in deleted_emails:
                         removed += 1
                         self.logger.info(f"✅ Regel gelöscht: {email}")
                     else:
@@ -289,9 +295,11 @@ class SeleniumMailSynchronizer:
                     "⚠️  Löschen übersprungen - verwende --allow-delete um Löschungen zu erlauben"
                 )
 
-        # Dann neue Regeln erstellen
-        for email in diff.to_add:
-            if self.strato_client.create_individual_rule(email):
+        # Dann neue Regeln erstellen (Filterregeln-Seite wird nur einmal geöffnet)
+        to_add = sorted(diff.to_add)
+        created_emails = set(self.strato_client.create_individual_rules_bulk(to_add))
+        for email in to_add:
+            if email in created_emails:
                 added += 1
                 self.logger.info(f"✅ Regel erstellt: {email}")
             else:
@@ -347,9 +355,11 @@ class SeleniumMailSynchronizer:
             else:
                 errors.append(f"Konnte nicht entfernen: {email}")
 
-        # Dann hinzufügen
-        for email in diff.to_add:
-            if self.strato_client.add_forwarding_address(email):
+        # Dann hinzufügen (gesammelt in einem Durchgang)
+        to_add = sorted(diff.to_add)
+        added_emails = set(self.strato_client.add_forwarding_addresses(to_add))
+        for email in to_add:
+            if email in added_emails:
                 added += 1
                 self.logger.info(f"✅ Hinzugefügt: {email}")
             else:
@@ -440,6 +450,10 @@ def test_strato_connection(config: SyncConfig, logger: logging.Logger) -> bool:
             headless=config.strato_webmail.headless,
             browser=config.strato_webmail.browser,
             timeout=config.strato_webmail.timeout,
+            poll_frequency=config.strato_webmail.poll_frequency,
+            debugger_address=config.strato_webmail.debugger_address,
+            profile_dir=config.strato_webmail.profile_dir,
+            debug_screenshots=config.strato_webmail.debug_screenshots,
         ),
         logger,
     )
@@ -0,0 +1,73 @@
+"""Tests für den lokalen Mitglieder-Cache des EasyVerein-Clients."""
+
+import json
+import logging
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from easystrat.config import EasyVereinConfig
+from easystrat.easyverein_client import EasyVereinClient, MemberInfo
+
+MEMBERS = [MemberInfo(id=1, email="anna@example.com", membership_number="7")]
+
+
+class MemberCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_file = Path(tmp.name) / "cache.json"
+
+    def make_client(self, cache_ttl=60):
+        config = EasyVereinConfig(
+            api_key="key", cache_ttl=cache_ttl, cache_file=str(self.cache_file)
+        )
+        return EasyVereinClient(config, logging.getLogger("test"))
+
+    def test_round_trip(self):
+        client = self.make_client()
+        client._write_cache("k", MEMBERS)
+
+        self.assertEqual(client._read_cache("k"), MEMBERS)
+
+    def test_disabled_cache_is_neither_written_nor_read(self):
+        client = self.make_client(cache_ttl=0)
+        client._write_cache("k", MEMBERS)
+
+        self.assertFalse(self.cache_file.exists())
+        self.assertIsNone(client._read_cache("k"))
+
+    def test_key_mismatch(self):
+        client = self.make_client()
+        client._write_cache("k", MEMBERS)
+
+        self.assertIsNone(client._read_cache("anderer-key"))
+
+    def test_expired_cache(self):
+        client = self.make_client(cache_ttl=60)
+        data = {"key": "k", "timestamp": time.time() - 120, "members": []}
+        self.cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        self.assertIsNone(client._read_cache("k"))
+
+    def test_missing_file(self):
+        self.assertIsNone(self.make_client()._read_cache("k"))
+
+    def test_corrupt_files(self):
+        client = self.make_client()
+        for content in (
+            "{kein json",
+            "[]",
+            "42",
+            "null",
+            '{"key": "k", "timestamp": 1e20, "members": [1]}',
+            '{"key": "k", "timestamp": 1e20, "members": [{"unbekannt": 1}]}',
+        ):
+            with self.subTest(content=content):
+                self.cache_file.write_text(content, encoding="utf-8")
+                self.assertIsNone(client._read_cache("k"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""Tests für das gesammelte Eintragen von Umleitungsadressen (ohne Browser)."""
+
+import logging
+import unittest
+from unittest.mock import patch
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from easystrat.config import StratoWebmailConfig
+from easystrat.strato_selenium import (
+    ACTION_DROPDOWN_CSS,
+    COUNT_EMPTY_FIELDS_JS,
+    FILL_EMPTY_FIELDS_JS,
+    FIND_ADD_BUTTON_JS,
+    REDIRECT_INPUT_CSS,
+    REMOVE_ACTION_CSS,
+    REMOVE_UNUSED_ACTIONS_JS,
+    SELECT_OPTION_BY_VALUE_JS,
+    StratoSeleniumClient,
+)
+
+
+class FakeElement:
+    """Platzhalter für ein WebElement, das auf eine Aktionszeile verweist."""
+
+    def __init__(self, row=None):
+        self.row = row
+
+
+class FakeDriver:
+    """
+    Simuliert die Aktionsliste des Regel-Dialogs.
+
+    Jede Zeile ist ein Dict mit "redirect": None (noch kein Umleitungsfeld), "" (leeres
+    Feld) oder der eingetragenen Adresse. Nach einem Klick wird die Liste neu gerendert,
+    der alte "Aktion hinzufügen"-Button ist dann veraltet.
+    """
+
+    def __init__(self, rows, redirect_on_select=True, fill_limit=None):
+        self.rows = rows
+        self.redirect_on_select = redirect_on_select
+        self.fill_limit = fill_limit
+        self.add_button = FakeElement()
+        self.clicks = 0
+
+    def find_elements(self, by, css):
+        assert by == By.CSS_SELECTOR
+        if css == REDIRECT_INPUT_CSS:
+            return [FakeElement(r) for r in self.rows if r["redirect"] is not None]
+        if css in (ACTION_DROPDOWN_CSS, REMOVE_ACTION_CSS):
+            return [FakeElement(r) for r in self.rows]
+        raise AssertionError(f"Unerwarteter Selektor: {css}")
+
+    def execute_script(self, script, *args):
+        if script == COUNT_EMPTY_FIELDS_JS:
+            return sum(1 for r in self.rows if r["redirect"] == "")
+        if script == FIND_ADD_BUTTON_JS:
+            return self.add_button
+        if script == "arguments[0].click();":
+            if args[0] is not self.add_button:
+                raise StaleElementReferenceException("stale element reference")
+            self.clicks += 1
+            self.rows.append({"redirect": None})
+            self.add_button = FakeElement()
+            return None
+        if script == SELECT_OPTION_BY_VALUE_JS:
+            if self.redirect_on_select:
+                args[0].row["redirect"] = ""
+            return "redirect"
+        if script == FILL_EMPTY_FIELDS_JS:
+            empty = [r for r in self.rows if r["redirect"] == ""][: self.fill_limit]
+            values = args[1]
+            for row, value in zip(empty, values):
+                row["redirect"] = value
+            return min(len(empty), len(values))
+        if script == REMOVE_UNUSED_ACTIONS_JS:
+            kept = self.rows[: args[2]]
+            added = self.rows[args[2] :]
+            self.rows = kept + [r for r in added if r["redirect"]]
+            return len(added) - (len(self.rows) - len(kept))
+        raise AssertionError(f"Unerwartetes Script: {script[:40]}")
+
+
+class FillRedirectFieldsBatchTest(unittest.TestCase):
+    def make_client(self, driver):
+        client = StratoSeleniumClient(
+            StratoWebmailConfig(email="verteiler@example.com", password="geheim"),
+            logging.getLogger("test"),
+        )
+        client.driver = driver
+        return client
+
+    def fill(self, driver, emails):
+        client = self.make_client(driver)
+        # Kurze Timeouts, damit der Fehlerfall nicht 5s dauert
+        with patch.object(
+            client, "_wait", lambda timeout: WebDriverWait(driver, 0.05, poll_frequency=0.01)
+        ):
+            return client._fill_redirect_fields_batch(emails)
+
+    def test_adds_one_row_per_missing_address(self):
+        driver = FakeDriver([{"redirect": "alt@example.com"}])
+
+        filled = self.fill(driver, ["a@example.com", "b@example.com"])
+
+        self.assertEqual(filled, 2)
+        self.assertEqual(driver.clicks, 2)
+        self.assertEqual(
+            [r["redirect"] for r in driver.rows],
+            ["alt@example.com", "a@example.com", "b@example.com"],
+        )
+
+    def test_reuses_empty_fields_without_adding_rows(self):
+        driver = FakeDriver([{"redirect": ""}])
+
+        filled = self.fill(driver, ["a@example.com"])
+
+        self.assertEqual(filled, 1)
+        self.assertEqual(driver.clicks, 0)
+
+    def test_removes_added_rows_when_field_does_not_appear(self):
+        driver = FakeDriver([{"redirect": "alt@example.com"}], redirect_on_select=False)
+
+        with self.assertRaises(TimeoutException):
+            self.fill(driver, ["a@example.com", "b@example.com"])
+
+        self.assertEqual(driver.rows, [{"redirect": "alt@example.com"}])
+
+    def test_partial_fill_keeps_filled_rows_only(self):
+        driver = FakeDriver([{"redirect": "alt@example.com"}], fill_limit=1)
+
+        filled = self.fill(driver, ["a@example.com", "b@example.com"])
+
+        self.assertEqual(filled, 1)
+        self.assertEqual([r["redirect"] for r in driver.rows], ["alt@example.com", "a@example.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()